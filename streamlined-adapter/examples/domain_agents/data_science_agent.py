@@ -9,19 +9,32 @@ It can answer domain-specific questions about data analysis, ML algorithms, and
 import os
 import sys
 import json
+from functools import lru_cache
 from typing import Dict, Any
 
 # Add the parent directory to the path so we can import nanda_core
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from nanda_core.core.adapter import NANDA
+from nanda_core.utils import KeywordMatcher
 
 class DataScienceAgent:
     """Data Science domain expert agent"""
     
+    # Keywords the specific questions test for, plus the broader topic keywords;
+    # all of them are matched in a single scan per message
+    KEYWORDS = (
+        "anomaly detection", "time series", "bagging", "boosting", "missing values",
+        "missing data", "ethical", "ethics", "bias", "nlp", "natural language", "deep learning"
+    )
+    GENERAL_KEYWORDS = frozenset({
+        "data", "machine learning", "ml", "statistics", "analysis", "model"
+    })
+    
     def __init__(self, agent_id: str, structure_type: str):
         self.agent_id = agent_id
         self.structure_type = structure_type
+        self._matcher = KeywordMatcher.shared(self.KEYWORDS + tuple(self.GENERAL_KEYWORDS))
         
         # Domain-specific knowledge base
         self.knowledge_base = {
@@ -36,6 +49,16 @@ class DataScienceAgent:
             "nlp_deep_learning": "For NLP projects, I've used transformer architectures like BERT for text classification, GPT for generation, and T5 for text-to-text tasks. Key considerations include tokenization, attention mechanisms, fine-tuning strategies, and handling domain-specific vocabulary."
         }
         
+        # Precompute full responses so agent_logic is a plain table lookup
+        prefix = f"🔬 Data Science Expert ({structure_type}): "
+        self._responses = {key: prefix + answer for key, answer in self.knowledge_base.items()}
+        self._general_response = prefix + "I specialize in data science and machine learning. I can help with statistical analysis, predictive modeling, feature engineering, model evaluation, and ML deployment. What specific data science challenge are you working on?"
+        self._default_response = prefix + "Hello! I'm a data science specialist. I can help with machine learning, statistical analysis, data preprocessing, model development, and AI ethics. How can I assist you with your data science needs?"
+        
+        # Answers depend on the message alone, so repeated questions (retries,
+        # resent prompts) are served from a bounded per-agent cache
+        self._cached_answer = lru_cache(maxsize=2048)(self._answer)
+        
         # Capability structure based on type
         if structure_type == "keywords":
             self.capabilities = {
@@ -55,31 +78,35 @@ class DataScienceAgent:
     
     def agent_logic(self, message: str, conversation_id: str) -> str:
         """Process incoming messages and provide data science expertise"""
+        return self._cached_answer(message)
+    
+    def _answer(self, message: str) -> str:
+        """Pick the data science response for a message"""
         
-        message_lower = message.lower()
+        found = self._matcher.find(message)
         
         # Handle domain-specific questions
-        if "anomaly detection" in message_lower or "time series" in message_lower:
-            return f"🔬 Data Science Expert ({self.structure_type}): {self.knowledge_base['anomaly_detection']}"
+        if "anomaly detection" in found or "time series" in found:
+            return self._responses['anomaly_detection']
         
-        elif "bagging" in message_lower and "boosting" in message_lower:
-            return f"🔬 Data Science Expert ({self.structure_type}): {self.knowledge_base['bagging_vs_boosting']}"
+        elif "bagging" in found and "boosting" in found:
+            return self._responses['bagging_vs_boosting']
         
-        elif "missing values" in message_lower or "missing data" in message_lower:
-            return f"🔬 Data Science Expert ({self.structure_type}): {self.knowledge_base['missing_values']}"
+        elif "missing values" in found or "missing data" in found:
+            return self._responses['missing_values']
         
-        elif "ethical" in message_lower or "ethics" in message_lower or "bias" in message_lower:
-            return f"🔬 Data Science Expert ({self.structure_type}): {self.knowledge_base['ai_ethics']}"
+        elif "ethical" in found or "ethics" in found or "bias" in found:
+            return self._responses['ai_ethics']
         
-        elif "nlp" in message_lower or "natural language" in message_lower or "deep learning" in message_lower:
-            return f"🔬 Data Science Expert ({self.structure_type}): {self.knowledge_base['nlp_deep_learning']}"
+        elif "nlp" in found or "natural language" in found or "deep learning" in found:
+            return self._responses['nlp_deep_learning']
         
         # General data science response
-        elif any(keyword in message_lower for keyword in ["data", "machine learning", "ml", "statistics", "analysis", "model"]):
-            return f"🔬 Data Science Expert ({self.structure_type}): I specialize in data science and machine learning. I can help with statistical analysis, predictive modeling, feature engineering, model evaluation, and ML deployment. What specific data science challenge are you working on?"
+        elif self.GENERAL_KEYWORDS & found:
+            return self._general_response
         
         # Default response
-        return f"🔬 Data Science Expert ({self.structure_type}): Hello! I'm a data science specialist. I can help with machine learning, statistical analysis, data preprocessing, model development, and AI ethics. How can I assist you with your data science needs?"
+        return self._default_response
 
 def main():
     """Main function to run the data science agent"""
@@ -77,6 +77,23 @@ def analyze_multiple_stocks(tickers: list, period: str = "1mo") -> dict:
     
     return summary
 
+# Set on every run, so they are left out of the reply's ETag
+VOLATILE_FIELDS = ("timestamp", "analysis_timestamp")
+
+def etag_key(reply: str) -> str:
+    """Reply text minus run timestamps, so unchanged market data keeps the same ETag"""
+    try:
+        data = json.loads(reply)
+    except ValueError:
+        return reply
+    if not isinstance(data, dict):
+        return reply
+    records = [data] + [stock for stock in data.get("stocks", {}).values() if isinstance(stock, dict)]
+    for record in records:
+        for field in VOLATILE_FIELDS:
+            record.pop(field, None)
+    return json.dumps(data, sort_keys=True)
+
 def process_message(message: str, conversation_id: str) -> str:
     """Process incoming messages and return analysis"""
     text = message.strip()
@@ -123,6 +140,8 @@ Financial Advisor Agent - Available Commands:
 Supported periods: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
 """
 
+process_message.etag_key = etag_key
+
 if __name__ == "__main__":
     # Configuration
     AGENT_ID = "financial-advisor-001"
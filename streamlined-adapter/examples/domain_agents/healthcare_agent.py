@@ -9,19 +9,33 @@ It can answer domain-specific questions about healthcare AI, medical systems, an
 import os
 import sys
 import json
+from functools import lru_cache
 from typing import Dict, Any
 
 # Add the parent directory to the path so we can import nanda_core
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from nanda_core.core.adapter import NANDA
+from nanda_core.utils import KeywordMatcher
 
 class HealthcareAgent:
     """Healthcare domain expert agent"""
     
+    # Keywords the specific questions test for, plus the broader topic keywords;
+    # all of them are matched in a single scan per message
+    KEYWORDS = (
+        "early", "detection", "integration", "healthcare", "hospital", "privacy", "patient",
+        "data", "outcomes", "improve", "reliability", "accuracy", "medical recommendation"
+    )
+    GENERAL_KEYWORDS = frozenset({
+        "medical", "healthcare", "patient", "diagnosis", "treatment", "clinical", "hospital",
+        "ehr"
+    })
+    
     def __init__(self, agent_id: str, structure_type: str):
         self.agent_id = agent_id
         self.structure_type = structure_type
+        self._matcher = KeywordMatcher.shared(self.KEYWORDS + tuple(self.GENERAL_KEYWORDS))
         
         # Domain-specific knowledge base
         self.knowledge_base = {
@@ -36,6 +50,16 @@ class HealthcareAgent:
             "ai_medical_reliability": "Ensuring AI medical recommendation reliability: 1) Rigorous clinical validation and trials, 2) Continuous monitoring and performance metrics, 3) Human-in-the-loop verification, 4) Explainable AI for clinical transparency, 5) Regular model updates with new data, 6) Bias detection and mitigation, 7) Clear limitations and contraindications."
         }
         
+        # Precompute full responses so agent_logic is a plain table lookup
+        prefix = f"🏥 Healthcare Expert ({structure_type}): "
+        self._responses = {key: prefix + answer for key, answer in self.knowledge_base.items()}
+        self._general_response = prefix + "I specialize in healthcare AI and medical systems. I can help with medical diagnosis support, patient data analysis, clinical workflow optimization, healthcare technology integration, and medical ethics. What healthcare challenge are you addressing?"
+        self._default_response = prefix + "Hello! I'm a healthcare AI specialist. I can assist with medical diagnosis systems, patient data analytics, clinical decision support, and healthcare technology integration. How can I help with your healthcare project?"
+        
+        # Answers depend on the message alone, so repeated questions (retries,
+        # resent prompts) are served from a bounded per-agent cache
+        self._cached_answer = lru_cache(maxsize=2048)(self._answer)
+        
         # Capability structure based on type
         if structure_type == "keywords":
             self.capabilities = {
@@ -55,31 +79,35 @@ class HealthcareAgent:
     
     def agent_logic(self, message: str, conversation_id: str) -> str:
         """Process incoming messages and provide healthcare expertise"""
+        return self._cached_answer(message)
+    
+    def _answer(self, message: str) -> str:
+        """Pick the healthcare response for a message"""
         
-        message_lower = message.lower()
+        found = self._matcher.find(message)
         
         # Handle domain-specific questions
-        if "early" in message_lower and "detection" in message_lower:
-            return f"🏥 Healthcare Expert ({self.structure_type}): {self.knowledge_base['early_detection']}"
+        if "early" in found and "detection" in found:
+            return self._responses['early_detection']
         
-        elif "integration" in message_lower and ("healthcare" in message_lower or "hospital" in message_lower):
-            return f"🏥 Healthcare Expert ({self.structure_type}): {self.knowledge_base['ai_integration_challenges']}"
+        elif "integration" in found and ("healthcare" in found or "hospital" in found):
+            return self._responses['ai_integration_challenges']
         
-        elif "privacy" in message_lower and ("patient" in message_lower or "data" in message_lower):
-            return f"🏥 Healthcare Expert ({self.structure_type}): {self.knowledge_base['patient_privacy']}"
+        elif "privacy" in found and ("patient" in found or "data" in found):
+            return self._responses['patient_privacy']
         
-        elif "hospital" in message_lower and ("outcomes" in message_lower or "improve" in message_lower):
-            return f"🏥 Healthcare Expert ({self.structure_type}): {self.knowledge_base['hospital_ai_outcomes']}"
+        elif "hospital" in found and ("outcomes" in found or "improve" in found):
+            return self._responses['hospital_ai_outcomes']
         
-        elif "reliability" in message_lower or "accuracy" in message_lower or "medical recommendation" in message_lower:
-            return f"🏥 Healthcare Expert ({self.structure_type}): {self.knowledge_base['ai_medical_reliability']}"
+        elif "reliability" in found or "accuracy" in found or "medical recommendation" in found:
+            return self._responses['ai_medical_reliability']
         
         # General healthcare response
-        elif any(keyword in message_lower for keyword in ["medical", "healthcare", "patient", "diagnosis", "treatment", "clinical", "hospital", "ehr"]):
-            return f"🏥 Healthcare Expert ({self.structure_type}): I specialize in healthcare AI and medical systems. I can help with medical diagnosis support, patient data analysis, clinical workflow optimization, healthcare technology integration, and medical ethics. What healthcare challenge are you addressing?"
+        elif self.GENERAL_KEYWORDS & found:
+            return self._general_response
         
         # Default response
-        return f"🏥 Healthcare Expert ({self.structure_type}): Hello! I'm a healthcare AI specialist. I can assist with medical diagnosis systems, patient data analytics, clinical decision support, and healthcare technology integration. How can I help with your healthcare project?"
+        return self._default_response
 
 def main():
     """Main function to run the healthcare agent"""
@@ -11,8 +11,8 @@ import sys
 from datetime import datetime
 from dotenv import load_dotenv
 import anthropic
+import httpx
 import json
-import requests as requests
 
 # Add parent directory to path to import nanda_core
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
@@ -31,8 +31,21 @@ load_dotenv(env_path)
 print(f"🔑 Loading .env from: {env_path}")
 print(f"🔑 API Key loaded: {os.getenv('ANTHROPIC_API_KEY')[:20]}...")
 
-# Initialize Anthropic client
-client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+# Initialize Anthropic client on a pooled (HTTP/2 when available) transport so
+# concurrent conversations share a few multiplexed connections; calls to the
+# risk agent reuse the same keep-alive pool
+http_client = httpx.Client(
+    http2=HAS_H2,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=httpx.Timeout(120.0, connect=5.0)
+)
+client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'), http_client=http_client)
 
 def call_risk_assessment_agent(stock_data: dict) -> str:
     """
@@ -47,7 +60,7 @@ def call_risk_assessment_agent(stock_data: dict) -> str:
     RISK_AGENT_URL = os.getenv("RISK_AGENT_URL", "http://localhost:6004")
     
     try:
-        response = requests.post(
+        response = http_client.post(
             f"{RISK_AGENT_URL}/a2a",
             json={
                 "content": {
@@ -69,12 +82,14 @@ def call_risk_assessment_agent(stock_data: dict) -> str:
     except Exception as e:
         return f"Could not reach risk assessment agent: {str(e)}"
 
-# Tool function mapping
+# Tool adapters: take Claude's raw tool input dict and call the function
+# positionally, keeping each tool's argument defaults next to its dispatch
 TOOL_FUNCTIONS = {
-    "get_stock_info": get_stock_info,
-    "get_historical_prices": get_historical_prices,
-    "compare_stocks": compare_stocks,
-    "call_risk_assessment_agent": call_risk_assessment_agent
+    "get_stock_info": lambda d: get_stock_info(d["ticker"], d.get("period", "3mo"),
+                                               include_fundamentals=d.get("include_fundamentals", True)),
+    "get_historical_prices": lambda d: get_historical_prices(d["ticker"], d["start_date"], d["end_date"]),
+    "compare_stocks": lambda d: compare_stocks(d["tickers"], d.get("period", "3mo")),
+    "call_risk_assessment_agent": lambda d: call_risk_assessment_agent(d["stock_data"])
 }
 
 def process_message_with_tools(message: str, conversation_id: str) -> str:
@@ -120,32 +135,30 @@ IMPORTANT: Include a disclaimer that this is for educational purposes only and n
     # Handle tool calls in a loop
     while response.stop_reason == "tool_use":
         # Extract tool calls
-        tool_results = []
+        tool_use_blocks = [block for block in response.content if block.type == "tool_use"]
+        tool_results = [None] * len(tool_use_blocks)
         
-        for block in response.content:
-            if block.type == "tool_use":
-                tool_name = block.name
-                tool_input = block.input
-                
-                print(f"🔧 Claude is calling tool: {tool_name}")
-                print(f"   Input: {json.dumps(tool_input, indent=2)}")
-                
-                # Execute the tool
-                if tool_name in TOOL_FUNCTIONS:
-                    result = TOOL_FUNCTIONS[tool_name](**tool_input)
-                    print(f"   Result: {json.dumps(result, indent=2)[:200]}...")
-                    
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": json.dumps(result)
-                    })
-                else:
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": json.dumps({"error": f"Unknown tool: {tool_name}"})
-                    })
+        for i, block in enumerate(tool_use_blocks):
+            tool_name = block.name
+            tool_input = block.input
+            
+            print(f"🔧 Claude is calling tool: {tool_name}")
+            print(f"   Input: {json.dumps(tool_input, indent=2)}")
+            
+            # Execute the tool
+            tool_fn = TOOL_FUNCTIONS.get(tool_name)
+            if tool_fn is not None:
+                result = tool_fn(tool_input)
+                print(f"   Result: {json.dumps(result, indent=2)[:200]}...")
+                content = json.dumps(result)
+            else:
+                content = json.dumps({"error": f"Unknown tool: {tool_name}"})
+            
+            tool_results[i] = {
+                "type": "tool_result",
+                "tool_use_id": block.id,
+                "content": content
+            }
         
         # Add assistant response and tool results to conversation
         messages.append({"role": "assistant", "content": response.content})
@@ -163,10 +176,7 @@ IMPORTANT: Include a disclaimer that this is for educational purposes only and n
         print(f"🤖 Claude continued - Stop reason: {response.stop_reason}")
     
     # Extract final text response
-    final_response = ""
-    for block in response.content:
-        if hasattr(block, "text"):
-            final_response += block.text
+    final_response = "".join(block.text for block in response.content if block.type == "text")
     
     print(f"✅ Final response generated ({len(final_response)} chars)")
     
@@ -4,16 +4,30 @@ Report Summarizer Agent - Synthesizes financial data and generates investment re
 """
 
 import os
-import json
+import re
 import sys
+import asyncio
+import threading
+import time
 import anthropic
-import requests
+import httpx
+import numpy as np
+import orjson
 from datetime import datetime
+from functools import lru_cache
+from typing import AsyncIterator, Iterator, Optional, Tuple
 from dotenv import load_dotenv
 
 # Add parent directory to path to import nanda_core
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 from nanda_core.core.adapter import NANDA
+from nanda_core.utils import CircuitBreaker, TTLCache
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
 
 # Load environment variables
 load_dotenv()
@@ -21,17 +35,110 @@ load_dotenv()
 # Financial Advisor agent endpoint
 ADVISOR_URL = "http://localhost:6001/a2a"
 
+# Long-lived event loop that drives the async pipeline; NANDA calls
+# process_message synchronously from its server threads. Started on first use
+# so importing this module has no side effects.
+_LOOP = None
+_LOOP_LOCK = threading.Lock()
+
+def agent_loop() -> asyncio.AbstractEventLoop:
+    """Return the agent's event loop, starting its thread on first call"""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="summarizer-loop", daemon=True).start()
+    return _LOOP
+
+@lru_cache(maxsize=1)
+def http_client() -> httpx.AsyncClient:
+    """Keep-alive client so repeated agent calls reuse pooled connections (only used on agent_loop)"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        transport=httpx.AsyncHTTPTransport(retries=2),
+        timeout=30,
+        headers={"Content-Type": "application/json"}
+    )
+
+# Transient advisor failures are retried with exponential backoff; after more
+# than 5 failures in 30s the advisor is skipped for 60s
+ADVISOR_RETRIES = 3
+ADVISOR_BACKOFF = 0.3
+RETRY_STATUSES = {502, 503, 504}
+ADVISOR_BREAKER = CircuitBreaker(failure_threshold=5, window=30, reset_timeout=60)
+
+# Peers that advertise "msgpack" in their agent card capabilities are sent
+# msgpack on /a2a; everyone else (or a peer whose card can't be read) gets JSON
+MSGPACK_MIMETYPE = "application/msgpack"
+MSGPACK_HEADERS = {"Content-Type": MSGPACK_MIMETYPE, "Accept": MSGPACK_MIMETYPE}
+
+# Peer /a2a URL -> whether it accepts msgpack; an unreadable card is retried after a minute
+PEER_MSGPACK = TTLCache(maxsize=256, ttl=3600)
+PEER_CARD_RETRY = 60
+
+async def peer_accepts_msgpack(url: str) -> bool:
+    """Read the peer's agent card once to decide whether it takes msgpack messages"""
+    accepts = PEER_MSGPACK.get(url)
+    if accepts is not None:
+        return accepts
+    try:
+        response = await http_client().get(f"{url.rstrip('/')}/agent.json", headers={"Accept": "application/json"})
+        response.raise_for_status()
+        accepts = orjson.loads(response.content).get("capabilities", {}).get("msgpack") is True
+        PEER_MSGPACK.set(url, accepts)
+    except Exception as e:
+        print(f"⚠️ Could not read agent card for {url} ({e}); sending JSON")
+        accepts = False
+        PEER_MSGPACK.set(url, accepts, ttl=PEER_CARD_RETRY)
+    return accepts
+
+async def post_a2a(url: str, payload: dict, headers: Optional[dict] = None) -> httpx.Response:
+    """POST an A2A message, binary-encoded when the peer supports it"""
+    if HAS_MSGPACK and await peer_accepts_msgpack(url):
+        response = await http_client().post(url, content=msgpack.packb(payload), headers={**MSGPACK_HEADERS, **(headers or {})})
+        if response.status_code != 415:
+            return response
+        # 415 means the message was rejected unprocessed, so resending it as JSON is safe
+        PEER_MSGPACK.set(url, False)
+    return await http_client().post(url, content=orjson.dumps(payload), headers=headers)
+
+def decode_a2a(response: httpx.Response) -> dict:
+    """Decode an A2A response body in whichever encoding the peer used"""
+    if response.headers.get("content-type", "").startswith(MSGPACK_MIMETYPE):
+        return msgpack.unpackb(response.content, raw=False)
+    return orjson.loads(response.content)
+
+# Recent advisor responses keyed on (sorted tickers, period)
+FINANCIAL_DATA_CACHE = TTLCache(maxsize=512, ttl=60)
+
+# Last (ETag, data) per (sorted tickers, period); once the TTL cache expires the
+# advisor is asked with If-None-Match and answers 304 if nothing changed
+ADVISOR_ETAGS = TTLCache(maxsize=512, ttl=3600)
+
 # Initialize Anthropic client
 api_key = os.getenv("ANTHROPIC_API_KEY")
 if api_key:
-    client = anthropic.Anthropic(api_key=api_key)
+    client = anthropic.AsyncAnthropic(api_key=api_key)
     USE_LLM = True
 else:
     print("⚠️  No ANTHROPIC_API_KEY found - using template-based summaries")
     USE_LLM = False
 
-def fetch_financial_data(tickers: list, period: str = "1mo") -> dict:
-    """Request financial data from the Financial Advisor agent"""
+async def fetch_financial_data(tickers: list, period: str = "1mo") -> dict:
+    """Request financial data from the Financial Advisor agent (cached for a short TTL)"""
+    key = (tuple(sorted(tickers)), period)
+    cached = FINANCIAL_DATA_CACHE.get(key)
+    if cached is not None:
+        print(f"⚡ Using cached Financial Advisor data for: {', '.join(tickers)}")
+        return cached
+    
+    result = await _request_financial_data(tickers, period)
+    if "error" not in result:
+        FINANCIAL_DATA_CACHE.set(key, result)
+    return result
+
+async def _request_financial_data(tickers: list, period: str) -> dict:
+    """Send the analysis request to the Financial Advisor agent"""
     try:
         # Format request
         request_text = f"analyze: {','.join(tickers)} {period}"
@@ -46,11 +153,42 @@ def fetch_financial_data(tickers: list, period: str = "1mo") -> dict:
             "conversation_id": f"summarizer-{datetime.now().timestamp()}"
         }
         
+        key = (tuple(sorted(tickers)), period)
+        validator = ADVISOR_ETAGS.get(key)
+        headers = {"If-None-Match": validator[0]} if validator else None
+        
+        if not ADVISOR_BREAKER.allow():
+            return {"error": "Financial Advisor is down (circuit open, retrying shortly)"}
+        
         print(f"📡 Requesting data from Financial Advisor: {request_text}")
-        response = requests.post(ADVISOR_URL, json=payload, timeout=30)
+        for attempt in range(ADVISOR_RETRIES):
+            if attempt:
+                await asyncio.sleep(ADVISOR_BACKOFF * 2 ** (attempt - 1))
+            try:
+                response = await post_a2a(ADVISOR_URL, payload, headers)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # Already retried by the transport
+                ADVISOR_BREAKER.record_failure()
+                raise
+            except httpx.TransportError:
+                if attempt == ADVISOR_RETRIES - 1:
+                    ADVISOR_BREAKER.record_failure()
+                    raise
+                continue
+            if response.status_code not in RETRY_STATUSES:
+                break
+        
+        if response.status_code in RETRY_STATUSES:
+            ADVISOR_BREAKER.record_failure()
+        else:
+            ADVISOR_BREAKER.record_success()
+        
+        if response.status_code == 304 and validator:
+            print(f"⚡ Financial Advisor data unchanged for: {', '.join(tickers)}")
+            return validator[1]
         
         if response.status_code == 200:
-            result = response.json()
+            result = decode_a2a(response)
             
             # Parse the nested response structure
             if "parts" in result and len(result["parts"]) > 0:
@@ -61,7 +199,11 @@ def fetch_financial_data(tickers: list, period: str = "1mo") -> dict:
                     text_content = text_content.split("] ", 1)[1] if "] " in text_content else text_content
                 
                 # Parse the JSON data
-                return json.loads(text_content)
+                data = orjson.loads(text_content)
+                etag = response.headers.get("etag")
+                if etag and "error" not in data:
+                    ADVISOR_ETAGS.set(key, (etag, data))
+                return data
         
         return {"error": f"HTTP {response.status_code}: {response.text}"}
         
@@ -69,14 +211,94 @@ def fetch_financial_data(tickers: list, period: str = "1mo") -> dict:
         print(f"❌ Error fetching data from Financial Advisor: {e}")
         return {"error": str(e)}
 
-def generate_llm_summary(financial_data: dict) -> str:
-    """Generate investment summary using Claude"""
+class SemanticCache:
+    """
+    Response cache that matches requests on embedding similarity.
+    
+    Entries are scoped (e.g. to the tickers, period and headline figures) so a
+    near-identical payload with different facts can never be returned; within a
+    scope, a stored response is reused when cosine similarity exceeds the threshold.
+    """
+    
+    def __init__(self, threshold: float = 0.92, ttl: float = 300.0, max_entries: int = 256):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = []  # (scope, response, created_at)
+        self._matrix = None  # stacked unit-norm embeddings, one row per entry
+        self._lock = threading.Lock()
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text as a unit vector, or None if no embedder is available"""
+        try:
+            from nanda_core.embeddings.embedding_manager import get_embedding_manager
+            vector = np.asarray(get_embedding_manager().create_embedding(text), dtype=np.float32)
+        except Exception as e:
+            print(f"⚠️ Semantic cache embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
     
-    # Create prompt
-    prompt = f"""You are a financial analyst assistant. Analyze the following stock market data and provide a comprehensive investment report.
+    def _evict_expired(self):
+        now = time.monotonic()
+        keep = [i for i, entry in enumerate(self._entries) if now - entry[2] < self.ttl]
+        if len(keep) != len(self._entries):
+            self._entries = [self._entries[i] for i in keep]
+            self._matrix = self._matrix[keep] if keep else None
+    
+    def lookup(self, scope, text: str):
+        """Return (cached_response_or_None, embedding) for text within scope"""
+        vector = self._embed(text)
+        if vector is None:
+            return None, None
+        
+        with self._lock:
+            self._evict_expired()
+            if self._matrix is not None and self._matrix.shape[1] == vector.shape[0]:
+                similarities = self._matrix @ vector
+                for i in np.argsort(similarities)[::-1]:
+                    if similarities[i] <= self.threshold:
+                        break
+                    if self._entries[i][0] == scope:
+                        self.hits += 1
+                        return self._entries[i][1], vector
+            self.misses += 1
+        return None, vector
+    
+    def store(self, scope, vector: Optional[np.ndarray], response: str):
+        """Store a response under the embedding returned by lookup()"""
+        if vector is None:
+            return
+        with self._lock:
+            if self._matrix is not None and self._matrix.shape[1] != vector.shape[0]:
+                # Embedder changed; older vectors are not comparable
+                self._entries, self._matrix = [], None
+            self._entries.append((scope, response, time.monotonic()))
+            row = vector[np.newaxis, :]
+            self._matrix = row if self._matrix is None else np.vstack([self._matrix, row])
+            if len(self._entries) > self.max_entries:
+                self._entries = self._entries[-self.max_entries:]
+                self._matrix = self._matrix[-self.max_entries:]
+    
+    def stats(self) -> dict:
+        """Get cache size and hit/miss statistics"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "threshold": self.threshold,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+SUMMARY_CACHE = SemanticCache()
 
-Financial Data:
-{json.dumps(financial_data, indent=2)}
+# Static report instructions, sent as a cacheable system block so only the
+# financial data varies between requests
+SUMMARY_SYSTEM_PROMPT = """You are a financial analyst assistant. Analyze the stock market data provided by the user and provide a comprehensive investment report.
 
 Please provide:
 1. Executive Summary (2-3 sentences)
@@ -88,115 +310,224 @@ Please provide:
 IMPORTANT: Include this disclaimer at the end:
 "⚠️ DISCLAIMER: This analysis is for informational purposes only and does not constitute financial advice. We are not Chartered Financial Analysts (CFA) or licensed financial advisors. Always consult with a qualified financial professional before making investment decisions."
 
-Format the report in a clear, professional manner with sections and bullet points."""
+Format the report in a clear, professional manner with sections and bullet points.
+
+The data is compact JSON: "period" is the lookback window and "stocks" maps each ticker to its metrics, using these keys:
+name = company name, sector = sector, px = current price (USD), chg = price change over the period (%), vol = average daily volume, mcap = market capitalization (USD), pe = trailing P/E ratio, hi52 / lo52 = 52-week high / low (USD), div = dividend yield, rec = analyst recommendation, err = data fetch error.
+Metrics that are unavailable are omitted."""
+
+# Long Financial Advisor field names -> short keys explained in SUMMARY_SYSTEM_PROMPT
+PROMPT_KEYS = {
+    "company_name": "name",
+    "sector": "sector",
+    "current_price": "px",
+    "price_change_pct": "chg",
+    "avg_volume": "vol",
+    "market_cap": "mcap",
+    "pe_ratio": "pe",
+    "52_week_high": "hi52",
+    "52_week_low": "lo52",
+    "dividend_yield": "div",
+    "recommendation": "rec",
+    "error": "err"
+}
 
+def _compact_for_prompt(financial_data: dict) -> dict:
+    """Strip timestamps and missing values, round floats and shorten keys to save input tokens"""
+    stocks = {}
+    periods = set()
+    for ticker, data in financial_data.get("stocks", {}).items():
+        compact = {}
+        for key, value in data.items():
+            short = PROMPT_KEYS.get(key)
+            if short is None:
+                if key == "period":
+                    periods.add(value)
+                continue
+            if value is None or value == "N/A":
+                continue
+            compact[short] = round(value, 2) if isinstance(value, float) else value
+        stocks[ticker] = compact
+    
+    result = {"stocks": stocks}
+    if len(periods) == 1:
+        result["period"] = periods.pop()
+    return result
+
+def summary_cache_scope(compact: dict) -> tuple:
+    """Exact-match part of the summary cache key: period plus each ticker's price and change"""
+    # Embeddings barely separate "1mo" from "1y" or one price from another (and CLIP
+    # truncates long payloads), so the figures a report quotes must match exactly
+    return (compact.get("period"),) + tuple(
+        (ticker, stock.get("px"), stock.get("chg")) for ticker, stock in sorted(compact["stocks"].items())
+    )
+
+SUMMARY_SYSTEM_BLOCKS = [{"type": "text", "text": SUMMARY_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
+async def stream_llm_summary(financial_data: dict) -> AsyncIterator[str]:
+    """Generate investment summary using Claude, yielding text as it is generated"""
+    
+    # Only the data is dynamic; instructions live in the cached system prompt
+    compact = _compact_for_prompt(financial_data)
+    prompt = f"""Financial Data:
+{orjson.dumps(compact).decode()}"""
+    
+    # Reuse a previous report for the same stocks, period and prices when the rest is near-identical
+    scope = summary_cache_scope(compact)
+    cached, embedding = await asyncio.to_thread(
+        SUMMARY_CACHE.lookup, scope, orjson.dumps(compact, option=orjson.OPT_SORT_KEYS).decode()
+    )
+    if cached is not None:
+        print(f"⚡ Reusing semantically cached summary for: {', '.join(sorted(compact['stocks']))}")
+        yield cached
+        return
+
+    chunks = []
     try:
-        message = client.messages.create(
+        async with client.messages.stream(
             model="claude-sonnet-4-5-20250929",
             max_tokens=2048,
+            system=SUMMARY_SYSTEM_BLOCKS,
             messages=[
                 {"role": "user", "content": prompt}
             ]
-        )
+        ) as stream:
+            async for text in stream.text_stream:
+                chunks.append(text)
+                yield text
+            message = await stream.get_final_message()
         
-        return message.content[0].text
+        print(f"🧠 LLM summary generated ({message.usage.cache_read_input_tokens or 0} cached input tokens)")
+        
+        SUMMARY_CACHE.store(scope, embedding, "".join(chunks))
         
     except Exception as e:
         print(f"❌ Error generating LLM summary: {e}")
-        return generate_template_summary(financial_data)
+        if not chunks:
+            yield generate_template_summary(financial_data)
+        else:
+            yield f"\n\n❌ Report generation interrupted: {str(e)}"
+
+async def generate_llm_summary(financial_data: dict) -> str:
+    """Generate investment summary using Claude"""
+    return "".join([chunk async for chunk in stream_llm_summary(financial_data)])
+
+TEMPLATE_HEADER = "# INVESTMENT ANALYSIS REPORT\n\n"
+
+TEMPLATE_FOOTER = (
+    "\n## Risk Factors\n\n"
+    "- Market volatility may impact short-term performance\n"
+    "- Sector-specific risks should be evaluated\n"
+    "- Economic conditions may affect overall market sentiment\n\n"
+    "---\n\n"
+    "⚠️ **DISCLAIMER:** This analysis is for informational purposes only and does not constitute financial advice. "
+    "We are not Chartered Financial Analysts (CFA) or licensed financial advisors. "
+    "Always consult with a qualified financial professional before making investment decisions.\n"
+)
 
 def generate_template_summary(financial_data: dict) -> str:
     """Generate a template-based summary (fallback)"""
     
     stocks = financial_data.get("stocks", {})
     
-    report = "# INVESTMENT ANALYSIS REPORT\n\n"
-    report += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-    report += f"**Stocks Analyzed:** {financial_data.get('total_stocks_analyzed', 0)}\n\n"
-    
-    report += "## Executive Summary\n\n"
-    report += f"Analyzed {len(stocks)} stock(s) to provide investment insights.\n\n"
-    
-    report += "## Individual Stock Analysis\n\n"
+    parts = [
+        TEMPLATE_HEADER,
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        f"**Stocks Analyzed:** {financial_data.get('total_stocks_analyzed', 0)}\n\n",
+        "## Executive Summary\n\n",
+        f"Analyzed {len(stocks)} stock(s) to provide investment insights.\n\n",
+        "## Individual Stock Analysis\n\n"
+    ]
+    append = parts.append
     
     for ticker, data in stocks.items():
         if "error" in data:
-            report += f"### {ticker}\n"
-            report += f"❌ Analysis failed: {data['error']}\n\n"
+            append(f"### {ticker}\n❌ Analysis failed: {data['error']}\n\n")
             continue
         
-        report += f"### {data.get('company_name', ticker)} ({ticker})\n\n"
-        report += f"- **Current Price:** ${data.get('current_price', 'N/A')}\n"
-        report += f"- **Price Change:** {data.get('price_change_pct', 'N/A')}%\n"
-        report += f"- **Sector:** {data.get('sector', 'N/A')}\n"
-        report += f"- **P/E Ratio:** {data.get('pe_ratio', 'N/A')}\n"
-        report += f"- **52-Week Range:** ${data.get('52_week_low', 'N/A')} - ${data.get('52_week_high', 'N/A')}\n"
-        report += f"- **Analyst Recommendation:** {data.get('recommendation', 'N/A').upper()}\n\n"
+        append(
+            f"### {data.get('company_name', ticker)} ({ticker})\n\n"
+            f"- **Current Price:** ${data.get('current_price', 'N/A')}\n"
+            f"- **Price Change:** {data.get('price_change_pct', 'N/A')}%\n"
+            f"- **Sector:** {data.get('sector', 'N/A')}\n"
+            f"- **P/E Ratio:** {data.get('pe_ratio', 'N/A')}\n"
+            f"- **52-Week Range:** ${data.get('52_week_low', 'N/A')} - ${data.get('52_week_high', 'N/A')}\n"
+            f"- **Analyst Recommendation:** {data.get('recommendation', 'N/A').upper()}\n\n"
+        )
         
         # Simple recommendation logic
         price_change = data.get('price_change_pct', 0)
         if price_change and price_change > 5:
-            report += f"📈 **Trending:** Strong upward momentum ({price_change}%)\n"
+            append(f"📈 **Trending:** Strong upward momentum ({price_change}%)\n")
         elif price_change and price_change < -5:
-            report += f"📉 **Note:** Significant decline ({price_change}%)\n"
+            append(f"📉 **Note:** Significant decline ({price_change}%)\n")
         
-        report += "\n"
+        append("\n")
     
-    report += "## Investment Recommendations\n\n"
-    report += "Based on the analyzed data:\n\n"
+    append("## Investment Recommendations\n\nBased on the analyzed data:\n\n")
     
     for ticker, data in stocks.items():
         if "error" not in data:
             recommendation = data.get('recommendation', 'hold')
-            report += f"- **{ticker}:** Consider the analyst recommendation of '{recommendation.upper()}'\n"
+            append(f"- **{ticker}:** Consider the analyst recommendation of '{recommendation.upper()}'\n")
     
-    report += "\n## Risk Factors\n\n"
-    report += "- Market volatility may impact short-term performance\n"
-    report += "- Sector-specific risks should be evaluated\n"
-    report += "- Economic conditions may affect overall market sentiment\n\n"
+    append(TEMPLATE_FOOTER)
     
-    report += "---\n\n"
-    report += "⚠️ **DISCLAIMER:** This analysis is for informational purposes only and does not constitute financial advice. "
-    report += "We are not Chartered Financial Analysts (CFA) or licensed financial advisors. "
-    report += "Always consult with a qualified financial professional before making investment decisions.\n"
-    
-    return report
+    return "".join(parts)
 
-def process_message(message: str, conversation_id: str) -> str:
-    """Process incoming messages and generate reports"""
-    text = message.strip()
+# "summarize: AAPL,GOOGL,MSFT [period]"
+SUMMARIZE_RE = re.compile(r"^\s*summarize:\s*([\w.,^=-]+)(?:\s+(\w+))?", re.IGNORECASE)
+
+@lru_cache(maxsize=256)
+def parse_summarize_request(message: str) -> Optional[Tuple[Tuple[str, ...], str]]:
+    """Parse a summarize command into (tickers, period), or None if it is not one"""
+    match = SUMMARIZE_RE.match(message)
+    if match is None:
+        return None
+    return tuple(match.group(1).split(",")), match.group(2) or "1mo"
+
+async def process_message_stream_async(message: str, conversation_id: str) -> AsyncIterator[str]:
+    """Process incoming messages and generate reports, yielding the response in chunks"""
+    request = parse_summarize_request(message)
     
     # Parse request: "summarize: AAPL,GOOGL,MSFT [period]"
-    if text.lower().startswith("summarize:"):
-        parts = text[10:].strip().split()
-        tickers = parts[0].split(",")
-        period = parts[1] if len(parts) > 1 else "1mo"
+    if request is not None:
+        tickers, period = list(request[0]), request[1]
         
         print(f"📊 Generating report for: {', '.join(tickers)}")
         
         # Fetch data from Financial Advisor
-        financial_data = fetch_financial_data(tickers, period)
+        financial_data = await fetch_financial_data(tickers, period)
         
         if "error" in financial_data and "stocks" not in financial_data:
-            return f"❌ Error: {financial_data['error']}\n\nMake sure the Financial Advisor agent is running on {ADVISOR_URL}"
+            yield f"❌ Error: {financial_data['error']}\n\nMake sure the Financial Advisor agent is running on {ADVISOR_URL}"
+            return
         
-        # Generate summary
         if USE_LLM:
-            summary = generate_llm_summary(financial_data)
+            async for chunk in stream_llm_summary(financial_data):
+                yield chunk
         else:
-            summary = generate_template_summary(financial_data)
-        
-        return summary
+            yield await asyncio.to_thread(generate_template_summary, financial_data)
+    
+    elif message.strip().lower() == "stats":
+        yield orjson.dumps({
+            "financial_data_cache": FINANCIAL_DATA_CACHE.stats(),
+            "summary_cache": SUMMARY_CACHE.stats(),
+            "advisor_circuit": ADVISOR_BREAKER.stats()
+        }, option=orjson.OPT_INDENT_2).decode()
     
     else:
         # Help message
-        return """
+        yield """
 Report Summarizer Agent - Available Commands:
 
 Summarize stocks and generate investment report:
   summarize: AAPL,GOOGL,MSFT [period]
   Example: summarize: AAPL,TSLA 3mo
 
+Show cache and circuit breaker statistics:
+  stats
+
 This agent will:
 1. Request data from the Financial Advisor agent
 2. Analyze the financial data
@@ -208,6 +539,28 @@ Supported periods: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
 Note: Financial Advisor must be running on http://localhost:6001
 """
 
+async def process_message_async(message: str, conversation_id: str) -> str:
+    """Process incoming messages and generate reports"""
+    return "".join([chunk async for chunk in process_message_stream_async(message, conversation_id)])
+
+def process_message(message: str, conversation_id: str) -> str:
+    """Synchronous entry point for NANDA; runs the async pipeline on the agent loop"""
+    return asyncio.run_coroutine_threadsafe(process_message_async(message, conversation_id), agent_loop()).result()
+
+def process_message_stream(message: str, conversation_id: str) -> Iterator[str]:
+    """Synchronous streaming entry point for NANDA; yields chunks produced on the agent loop"""
+    loop = agent_loop()
+    chunks = process_message_stream_async(message, conversation_id)
+    try:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(chunks.__anext__(), loop).result()
+            except StopAsyncIteration:
+                return
+    finally:
+        # Runs when the consumer stops early too; cancels the in-flight Claude stream / HTTP request
+        asyncio.run_coroutine_threadsafe(chunks.aclose(), loop).result()
+
 if __name__ == "__main__":
     # Configuration
     AGENT_ID = "report-summarizer-001"
@@ -225,6 +578,7 @@ if __name__ == "__main__":
     agent = NANDA(
         agent_id=AGENT_ID,
         agent_logic=process_message,
+        agent_logic_stream=process_message_stream,
         port=PORT,
         public_url=PUBLIC_URL,
         enable_telemetry=False,
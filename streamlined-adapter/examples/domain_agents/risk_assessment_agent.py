@@ -9,6 +9,7 @@ Provides risk scores, volatility analysis, and risk mitigation strategies.
 import os
 import sys
 from datetime import datetime
+from typing import Iterator
 from dotenv import load_dotenv
 import anthropic
 # Add parent directory to path
@@ -23,17 +24,8 @@ load_dotenv(env_path)
 # Initialize Anthropic client
 client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
 
-
-def process_risk_assessment(message: str, conversation_id: str) -> str:
-    """
-    Assess investment risks using Claude.
-    Expects stock data in JSON format.
-    """
-    
-    print(f"\n🛡️ [{conversation_id}] Risk Assessment Request")
-    
-    # System prompt for risk assessment specialist
-    system_prompt = """You are a specialized Risk Assessment Analyst for investments.
+# System prompt for risk assessment specialist
+SYSTEM_PROMPT = """You are a specialized Risk Assessment Analyst for investments.
 
 Your role is to:
 1. Analyze stock data and identify ALL potential risks
@@ -55,38 +47,65 @@ Format your response with:
 
 Always err on the side of caution."""
 
+# Static system prompt sent as a cacheable block so repeat requests reuse the
+# prompt cache instead of re-processing it
+SYSTEM_BLOCKS = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
+
+RISK_DISCLAIMER = """
+---
+⚠️ Risk Disclaimer: This risk assessment is for educational purposes only. 
+Past performance does not guarantee future results. Always consult with a 
+qualified financial advisor before making investment decisions.
+"""
+
+
+def process_risk_assessment_stream(message: str, conversation_id: str) -> Iterator[str]:
+    """
+    Assess investment risks using Claude, yielding the report as it is generated.
+    Expects stock data in JSON format.
+    """
+    
+    print(f"\n🛡️ [{conversation_id}] Risk Assessment Request")
+    
+    yield f"""[risk-assessment-agent]
+
+RISK ASSESSMENT REPORT
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+"""
+    
     try:
-        # Call Claude for risk analysis
-        response = client.messages.create(
+        # Stream Claude's risk analysis so callers see the first tokens immediately
+        with client.messages.stream(
             model="claude-haiku-4-5-20251001",
             max_tokens=2048,
-            system=system_prompt,
+            system=SYSTEM_BLOCKS,
             messages=[{
                 "role": "user",
                 "content": f"Analyze the investment risks for this stock data:\n\n{message}"
             }]
-        )
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+            response = stream.get_final_message()
         
-        risk_analysis = response.content[0].text
+        print(f"✅ Risk assessment completed ({response.usage.output_tokens} output tokens, "
+              f"{response.usage.cache_read_input_tokens or 0} cached input tokens)")
         
-        print(f"✅ Risk assessment completed ({len(risk_analysis)} chars)")
-        
-        return f"""[risk-assessment-agent]
-
-RISK ASSESSMENT REPORT
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-{risk_analysis}
-
----
-⚠️ Risk Disclaimer: This risk assessment is for educational purposes only. 
-Past performance does not guarantee future results. Always consult with a 
-qualified financial advisor before making investment decisions.
-"""
+        yield "\n" + RISK_DISCLAIMER
         
     except Exception as e:
         print(f"❌ Error in risk assessment: {e}")
-        return f"[risk-assessment-agent]\n\nError performing risk assessment: {str(e)}"
+        yield f"\n\nError performing risk assessment: {str(e)}"
+
+
+def process_risk_assessment(message: str, conversation_id: str) -> str:
+    """
+    Assess investment risks using Claude.
+    Expects stock data in JSON format.
+    """
+    return "".join(process_risk_assessment_stream(message, conversation_id))
 
 
 if __name__ == "__main__":
@@ -105,6 +124,7 @@ if __name__ == "__main__":
     agent = NANDA(
         agent_id=AGENT_ID,
         agent_logic=process_risk_assessment,
+        agent_logic_stream=process_risk_assessment_stream,
         port=PORT,
         public_url=PUBLIC_URL,
         enable_telemetry=False,
@@ -4,7 +4,7 @@ Test script for Financial Analysis Multi-Agent System
 """
 
 import asyncio
-import json
+import orjson
 from python_a2a import A2AClient, Message, TextContent, MessageRole
 
 async def test_financial_advisor():
@@ -13,8 +13,8 @@ async def test_financial_advisor():
     print("TEST 1: Financial Advisor Agent (Direct)")
     print("="*60)
     
-    client = A2AClient()
     advisor_url = "http://localhost:6001/a2a"
+    client = A2AClient(advisor_url)
     
     # Test multiple stock analysis
     message = Message(
@@ -27,10 +27,10 @@ async def test_financial_advisor():
         print("📡 Sending request to Financial Advisor...")
         print("   Request: analyze: AAPL,GOOGL,MSFT 1mo")
         
-        response = await client.send_message(advisor_url, message)
+        response = await client.send_message_async(message)
         
         if isinstance(response.content, TextContent):
-            data = json.loads(response.content.text)
+            data = orjson.loads(response.content.text)
             print("\n✅ Response received!")
             print(f"\n📊 Analysis Summary:")
             print(f"   Total stocks: {data.get('total_stocks_analyzed', 0)}")
@@ -58,8 +58,8 @@ async def test_report_summarizer():
     print("TEST 2: Report Summarizer Agent (A2A Communication)")
     print("="*60)
     
-    client = A2AClient()
     summarizer_url = "http://localhost:6002/a2a"
+    client = A2AClient(summarizer_url)
     
     # Request summary report
     message = Message(
@@ -77,7 +77,7 @@ async def test_report_summarizer():
         print("   3. Generate comprehensive report")
         print("\n   Please wait...")
         
-        response = await client.send_message(summarizer_url, message)
+        response = await client.send_message_async(message)
         
         if isinstance(response.content, TextContent):
             print("\n✅ Report generated successfully!")
@@ -96,8 +96,8 @@ async def test_single_stock():
     print("TEST 3: Single Stock Deep Dive")
     print("="*60)
     
-    client = A2AClient()
     advisor_url = "http://localhost:6001/a2a"
+    client = A2AClient(advisor_url)
     
     message = Message(
         role=MessageRole.USER,
@@ -108,10 +108,10 @@ async def test_single_stock():
     try:
         print("📡 Requesting deep dive for TSLA (6 months)...")
         
-        response = await client.send_message(advisor_url, message)
+        response = await client.send_message_async(message)
         
         if isinstance(response.content, TextContent):
-            data = json.loads(response.content.text)
+            data = orjson.loads(response.content.text)
             print("\n✅ Analysis complete!")
             print(f"\n📈 {data.get('company_name', 'N/A')} ({data.get('ticker', 'N/A')})")
             print(f"   Current Price: ${data.get('current_price', 'N/A')}")
@@ -136,14 +136,15 @@ async def main():
     print("   ✓ Report Summarizer running on port 6002")
     print("\nStarting tests...\n")
     
-    # Run tests
-    test1 = await test_financial_advisor()
-    await asyncio.sleep(2)
-    
-    test2 = await test_single_stock()
-    await asyncio.sleep(2)
-    
-    test3 = await test_report_summarizer()
+    # Run tests concurrently; the agents are independent
+    results = await asyncio.gather(
+        test_financial_advisor(),
+        test_single_stock(),
+        test_report_summarizer(),
+        return_exceptions=True
+    )
+    # An exception object is truthy, so only a literal True counts as a pass
+    test1, test2, test3 = (result is True for result in results)
     
     # Summary
     print("\n" + "="*60)
@@ -1,28 +1,34 @@
 # Quick test script - save as test_mongodb.py
-from pymongo import MongoClient
+# Usage: python test_mongodb.py [--list]
 import os
+import sys
+from pymongo import MongoClient
+from pymongo.errors import ServerSelectionTimeoutError
 from dotenv import load_dotenv
 
 load_dotenv()
 
 try:
-    # Your MongoDB connection string
-    client = MongoClient(os.getenv('MONGODB_URI'))
-    
-    # Test the connection
-    client.admin.command('ping')
-    print("✅ MongoDB Atlas connected successfully!")
-    
-    # List your databases
-    print("\nDatabases:")
-    for db_name in client.list_database_names():
-        print(f"  - {db_name}")
-    
-    # Check your NANDA database
-    db = client['nanda']  # or whatever you named it
-    print(f"\nCollections in 'nanda' database:")
-    for collection in db.list_collection_names():
-        print(f"  - {collection}")
-        
+    # Your MongoDB connection string; fail fast instead of the default 30s
+    client = MongoClient(os.getenv('MONGODB_URI'), serverSelectionTimeoutMS=2000)
+
+    # Test the connection with a single round-trip
+    info = client.server_info()
+    print(f"✅ MongoDB Atlas connected successfully! (server {info.get('version', 'unknown')})")
+
+    # Enumerating databases/collections costs extra round-trips; opt in with --list
+    if "--list" in sys.argv[1:]:
+        print("\nDatabases:")
+        for db_name in client.list_database_names():
+            print(f"  - {db_name}")
+
+        # Check your NANDA database
+        db = client['nanda']  # or whatever you named it
+        print(f"\nCollections in 'nanda' database:")
+        for collection in db.list_collection_names(filter={}):
+            print(f"  - {collection}")
+
+except ServerSelectionTimeoutError as e:
+    print(f"❌ MongoDB server not reachable: {e}")
 except Exception as e:
-    print(f"❌ MongoDB connection failed: {e}")
\ No newline at end of file
+    print(f"❌ MongoDB connection failed: {e}")
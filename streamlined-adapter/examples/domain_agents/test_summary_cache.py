@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test that the Report Summarizer's semantic cache only reuses a summary for the
+same tickers, period and prices
+
+Claude and the embedder are replaced with in-memory fakes, so no API key is needed.
+"""
+
+import asyncio
+import os
+import sys
+import types
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import report_summarizer_agent as agent
+
+
+class FakeStream:
+    """Async context manager mimicking client.messages.stream"""
+
+    def __init__(self, text):
+        self.text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    @property
+    def text_stream(self):
+        async def chunks():
+            yield self.text
+        return chunks()
+
+    async def get_final_message(self):
+        return types.SimpleNamespace(usage=types.SimpleNamespace(cache_read_input_tokens=0))
+
+
+class FakeMessages:
+    def __init__(self):
+        self.calls = 0
+
+    def stream(self, **kwargs):
+        self.calls += 1
+        return FakeStream(f"report #{self.calls}")
+
+
+def financial_data(period="1mo", price=190.12):
+    return {"stocks": {
+        "AAPL": {"company_name": "Apple Inc.", "current_price": price, "price_change_pct": 2.5, "period": period},
+        "MSFT": {"company_name": "Microsoft", "current_price": 410.0, "price_change_pct": -1.25, "period": period},
+    }}
+
+
+def test_summary_cache_requires_same_period_and_prices():
+    """Payloads differing only in period or one price embed identically here, yet must miss"""
+    messages = FakeMessages()
+    agent.client = types.SimpleNamespace(messages=messages)
+    agent.SUMMARY_CACHE = agent.SemanticCache()
+    # Worst case for the embedder: every payload maps to the same vector
+    agent.SUMMARY_CACHE._embed = lambda text: np.ones(8, dtype=np.float32) / np.sqrt(8)
+
+    summarize = lambda data: asyncio.run(agent.generate_llm_summary(data))
+
+    assert summarize(financial_data()) == "report #1"
+    assert summarize(financial_data()) == "report #1"
+    assert summarize(financial_data(period="1y")) == "report #2"
+    assert summarize(financial_data(price=185.4)) == "report #3"
+    assert messages.calls == 3
+
+
+if __name__ == "__main__":
+    print("🧪 Testing summary cache scoping")
+    test_summary_cache_requires_same_period_and_prices()
+    print("✅ Summary cache tests passed")
@@ -4,52 +4,179 @@
 # Tools that Claude can use to fetch and analyze stock data.
 ########################################################
 
+import warnings
+import numpy as np
 import yfinance as yf
+from yfinance.exceptions import YFException
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, List
 
-def get_stock_info(ticker: str, period: str = "3mo") -> Dict[str, Any]:
+from nanda_core.utils import TTLCache
+
+try:
+    from curl_cffi import requests as curl_requests
+    HAS_CURL_CFFI = True
+except ImportError:
+    HAS_CURL_CFFI = False
+
+# One browser-impersonating HTTP/2 session shared by every Yahoo request so
+# lookups reuse connections; None lets yfinance pick its own session
+YF_SESSION = curl_requests.Session(impersonate="chrome", http_version="v2") if HAS_CURL_CFFI else None
+
+# What a Yahoo lookup can raise: yfinance's own errors, network errors (curl_cffi's and
+# requests' exceptions both subclass OSError) and KeyError/ValueError from missing
+# columns or malformed responses. Anything else is a bug and propagates.
+FETCH_ERRORS = (YFException, OSError, KeyError, ValueError)
+
+# Recent successful lookups keyed on (ticker, period, include_fundamentals);
+# yfinance .info is slow
+STOCK_INFO_CACHE = TTLCache(maxsize=512, ttl=60)
+
+def get_stock_info(ticker: str, period: str = "3mo", timeout: float = 10,
+                   include_fundamentals: bool = True) -> Dict[str, Any]:
     """
     Get comprehensive stock information for a single ticker.
     
     Args:
         ticker: Stock ticker symbol (e.g., AAPL, GOOGL, MSFT)
         period: Time period for historical data (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+        timeout: Seconds to wait for the price history request
+        include_fundamentals: Also fetch company name, sector, P/E, dividend yield and
+            analyst recommendation (requires the full, much larger quote summary)
     
     Returns:
         Dictionary containing current price, historical data, and key metrics
     """
+    key = (ticker, period, include_fundamentals)
+    cached = STOCK_INFO_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    result = _fetch_stock_info(ticker, period, timeout, include_fundamentals)
+    if "error" not in result:
+        STOCK_INFO_CACHE.set(key, result)
+    return result
+
+
+def _fast_info_value(fast_info, name: str) -> Any:
+    """Read a fast_info field, treating lookup failures as missing"""
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period=period)
-        info = stock.info
-        
-        if hist.empty:
-            return {"error": f"No data available for {ticker}"}
-        
-        current_price = hist['Close'].iloc[-1]
-        price_change = ((current_price - hist['Close'].iloc[0]) / hist['Close'].iloc[0]) * 100
-        
-        return {
-            "ticker": ticker,
-            "current_price": round(current_price, 2),
-            "price_change_pct": round(price_change, 2),
-            "period": period,
-            "avg_volume": int(hist['Volume'].mean()),
+        value = getattr(fast_info, name)
+    except Exception:
+        return 'N/A'
+    return 'N/A' if value is None else value
+
+
+def _price_stats(hist) -> Dict[str, Any]:
+    """Compute price and volume metrics from a price history DataFrame"""
+    close = hist['Close'].to_numpy()
+    current_price = close[-1]
+    price_change = (current_price - close[0]) / close[0] * 100
+    
+    return {
+        "current_price": round(float(current_price), 2),
+        "price_change_pct": round(float(price_change), 2),
+        "avg_volume": int(hist['Volume'].to_numpy().mean())
+    }
+
+
+def _quote_fields(stock: yf.Ticker, ticker: str, include_fundamentals: bool) -> Dict[str, Any]:
+    """Fetch market cap, 52-week range and (optionally) fundamentals for a ticker"""
+    # fast_info covers market cap and the 52-week range without the full quote summary
+    fast_info = stock.fast_info
+    
+    fields = {
+        "market_cap": _fast_info_value(fast_info, 'market_cap'),
+        "52_week_high": _fast_info_value(fast_info, 'year_high'),
+        "52_week_low": _fast_info_value(fast_info, 'year_low')
+    }
+    
+    if include_fundamentals:
+        info = stock.get_info()
+        fields.update({
             "company_name": info.get('longName', ticker),
             "sector": info.get('sector', 'N/A'),
-            "market_cap": info.get('marketCap', 'N/A'),
             "pe_ratio": info.get('trailingPE', 'N/A'),
-            "52_week_high": info.get('fiftyTwoWeekHigh', 'N/A'),
-            "52_week_low": info.get('fiftyTwoWeekLow', 'N/A'),
             "dividend_yield": info.get('dividendYield', 0),
-            "recommendation": info.get('recommendationKey', 'N/A'),
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
+            "recommendation": info.get('recommendationKey', 'N/A')
+        })
+    
+    return fields
+
+
+def _stock_info_result(ticker: str, period: str, price_stats: Dict[str, Any], quote: Dict[str, Any]) -> Dict[str, Any]:
+    """Assemble the get_stock_info response from price stats and quote fields"""
+    return {
+        "ticker": ticker,
+        "current_price": price_stats["current_price"],
+        "price_change_pct": price_stats["price_change_pct"],
+        "period": period,
+        "avg_volume": price_stats["avg_volume"],
+        **quote,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def _fetch_stock_info(ticker: str, period: str, timeout: float, include_fundamentals: bool) -> Dict[str, Any]:
+    """Fetch stock information from Yahoo Finance (uncached)"""
+    try:
+        stock = yf.Ticker(ticker, session=YF_SESSION)
+        hist = stock.history(period=period, timeout=timeout)
+        
+        if hist.empty:
+            return {"error": f"No data available for {ticker}"}
+        
+        return _stock_info_result(ticker, period, _price_stats(hist), _quote_fields(stock, ticker, include_fundamentals))
+    except FETCH_ERRORS as e:
         return {"error": f"Failed to fetch data for {ticker}: {str(e)}"}
 
 
+def _batch_history(tickers: List[str], period: str, timeout: float) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch price history for several tickers with a single yf.download call.
+    
+    Returns:
+        Price stats per ticker; tickers without price data are omitted
+    """
+    data = yf.download(tickers, period=period, session=YF_SESSION, group_by='ticker', auto_adjust=True,
+                       threads=True, progress=False, timeout=timeout)
+    
+    if data is None or data.empty:
+        return {}
+    
+    # Only tickers present in the download; columns line up across both matrices
+    available = set(data.columns.get_level_values(0))
+    requested = [ticker for ticker in tickers if ticker.upper() in available]
+    if not requested:
+        return {}
+    symbols = [ticker.upper() for ticker in requested]
+    
+    # [T, N] matrices; NaN marks days a ticker did not trade
+    close = data.xs('Close', level=1, axis=1)[symbols].to_numpy(dtype=float)
+    volume = data.xs('Volume', level=1, axis=1)[symbols].to_numpy(dtype=float)
+    
+    valid = ~np.isnan(close)
+    has_data = valid.any(axis=0)
+    columns = np.arange(close.shape[1])
+    first = close[valid.argmax(axis=0), columns]
+    last = close[close.shape[0] - 1 - valid[::-1].argmax(axis=0), columns]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct = np.round((last - first) / first * 100, 2)
+    avg_volume = np.where(valid, volume, 0).sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+    last = np.round(last, 2)
+    
+    return {
+        ticker: {
+            "current_price": float(last[i]),
+            "price_change_pct": float(pct[i]),
+            "avg_volume": int(avg_volume[i])
+        }
+        for i, ticker in enumerate(requested) if has_data[i]
+    }
+
+
 def get_historical_prices(ticker: str, start_date: str, end_date: str) -> Dict[str, Any]:
     """
     Get historical stock prices for a specific date range.
@@ -63,35 +190,44 @@ def get_historical_prices(ticker: str, start_date: str, end_date: str) -> Dict[s
         Dictionary with historical price data
     """
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.download(start=start_date, end=end_date)
+        stock = yf.Ticker(ticker, session=YF_SESSION)
+        hist = stock.history(start=start_date, end=end_date)
         
         if hist.empty:
             return {"error": f"No historical data for {ticker} between {start_date} and {end_date}"}
         
+        open_price = hist['Open'].to_numpy()[0]
+        close_price = hist['Close'].to_numpy()[-1]
+        
         return {
             "ticker": ticker,
             "start_date": start_date,
             "end_date": end_date,
             "data_points": len(hist),
-            "open_price": round(hist['Open'].iloc[0], 2),
-            "close_price": round(hist['Close'].iloc[-1], 2),
-            "high": round(hist['High'].max(), 2),
-            "low": round(hist['Low'].min(), 2),
-            "avg_volume": int(hist['Volume'].mean()),
-            "price_change_pct": round(((hist['Close'].iloc[-1] - hist['Open'].iloc[0]) / hist['Open'].iloc[0]) * 100, 2)
+            "open_price": round(float(open_price), 2),
+            "close_price": round(float(close_price), 2),
+            "high": round(float(hist['High'].to_numpy().max()), 2),
+            "low": round(float(hist['Low'].to_numpy().min()), 2),
+            "avg_volume": int(hist['Volume'].to_numpy().mean()),
+            "price_change_pct": round(float((close_price - open_price) / open_price * 100), 2)
         }
-    except Exception as e:
+    except FETCH_ERRORS as e:
         return {"error": f"Failed to fetch historical data: {str(e)}"}
 
 
-def compare_stocks(tickers: List[str], period: str = "3mo") -> Dict[str, Any]:
+def compare_stocks(tickers: List[str], period: str = "3mo", max_workers: int = 8, timeout: float = 10) -> Dict[str, Any]:
     """
     Compare multiple stocks side by side.
     
+    Price history for all uncached tickers is fetched in one batched
+    download; the per-ticker quote lookups run concurrently since each is
+    dominated by a network round-trip to Yahoo Finance.
+    
     Args:
         tickers: List of stock ticker symbols
         period: Time period for comparison
+        max_workers: Maximum number of quote lookups run in parallel
+        timeout: Per-request timeout in seconds
     
     Returns:
         Dictionary with comparative analysis data
@@ -103,13 +239,43 @@ def compare_stocks(tickers: List[str], period: str = "3mo") -> Dict[str, Any]:
             "timestamp": datetime.now().isoformat()
         }
         
+        if not tickers:
+            return comparison
+        
+        results = {}
         for ticker in tickers:
-            stock_data = get_stock_info(ticker, period)
-            if "error" not in stock_data:
+            cached = STOCK_INFO_CACHE.get((ticker, period, True))
+            if cached is not None:
+                results[ticker] = cached
+        missing = [ticker for ticker in dict.fromkeys(tickers) if ticker not in results]
+        
+        if missing:
+            histories = _batch_history(missing, period, timeout)
+            
+            def fetch_quote(ticker: str):
+                price_stats = histories.get(ticker)
+                if price_stats is None:
+                    return ticker, {"error": f"No data available for {ticker}"}
+                try:
+                    quote = _quote_fields(yf.Ticker(ticker, session=YF_SESSION), ticker, True)
+                except FETCH_ERRORS as e:
+                    return ticker, {"error": f"Failed to fetch data for {ticker}: {str(e)}"}
+                stock_data = _stock_info_result(ticker, period, price_stats, quote)
+                STOCK_INFO_CACHE.set((ticker, period, True), stock_data)
+                return ticker, stock_data
+            
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                results.update(executor.map(fetch_quote, missing))
+        
+        for ticker in tickers:
+            stock_data = results[ticker]
+            if "error" in stock_data:
+                warnings.warn(f"compare_stocks: skipping {ticker}: {stock_data['error']}")
+            else:
                 comparison["stocks"][ticker] = stock_data
         
         return comparison
-    except Exception as e:
+    except FETCH_ERRORS as e:
         return {"error": f"Failed to compare stocks: {str(e)}"}
 
 
@@ -129,6 +295,11 @@ FINANCIAL_TOOLS = [
                     "type": "string",
                     "description": "Time period for historical data analysis. Options: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max. Default is 3mo.",
                     "default": "3mo"
+                },
+                "include_fundamentals": {
+                    "type": "boolean",
+                    "description": "Include company name, sector, P/E ratio, dividend yield and analyst recommendation. Set to false when only price, volume, market cap and 52-week range are needed (faster). Default is true.",
+                    "default": True
                 }
             },
             "required": ["ticker"]
@@ -9,19 +9,33 @@ It can answer domain-specific questions about web development, performance optim
 import os
 import sys
 import json
+from functools import lru_cache
 from typing import Dict, Any
 
 # Add the parent directory to the path so we can import nanda_core
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from nanda_core.core.adapter import NANDA
+from nanda_core.utils import KeywordMatcher
 
 class WebDevelopmentAgent:
     """Web Development domain expert agent"""
     
+    # Keywords the specific questions test for, plus the broader topic keywords;
+    # all of them are matched in a single scan per message
+    KEYWORDS = (
+        "react", "optimize", "performance", "serverless", "serverless architecture", "security",
+        "api", "restful", "ci/cd", "continuous integration", "deployment", "state management",
+        "state", "front"
+    )
+    GENERAL_KEYWORDS = frozenset({
+        "web", "frontend", "backend", "javascript", "react", "node", "api", "html", "css"
+    })
+    
     def __init__(self, agent_id: str, structure_type: str):
         self.agent_id = agent_id
         self.structure_type = structure_type
+        self._matcher = KeywordMatcher.shared(self.KEYWORDS + tuple(self.GENERAL_KEYWORDS))
         
         # Domain-specific knowledge base
         self.knowledge_base = {
@@ -36,6 +50,16 @@ class WebDevelopmentAgent:
             "state_management": "For complex front-end state management: 1) Redux Toolkit for predictable state updates, 2) Zustand for simpler state needs, 3) React Query for server state, 4) Context API for component tree state, 5) Consider state colocation and avoid over-engineering."
         }
         
+        # Precompute full responses so agent_logic is a plain table lookup
+        prefix = f"💻 Web Dev Expert ({structure_type}): "
+        self._responses = {key: prefix + answer for key, answer in self.knowledge_base.items()}
+        self._general_response = prefix + "I specialize in full-stack web development. I can help with React, Node.js, API design, database integration, performance optimization, security, and deployment. What web development challenge are you facing?"
+        self._default_response = prefix + "Hello! I'm a full-stack web development specialist. I can help with modern JavaScript frameworks, server-side development, API architecture, and deployment strategies. How can I assist with your web development project?"
+        
+        # Answers depend on the message alone, so repeated questions (retries,
+        # resent prompts) are served from a bounded per-agent cache
+        self._cached_answer = lru_cache(maxsize=2048)(self._answer)
+        
         # Capability structure based on type
         if structure_type == "keywords":
             self.capabilities = {
@@ -55,31 +79,35 @@ class WebDevelopmentAgent:
     
     def agent_logic(self, message: str, conversation_id: str) -> str:
         """Process incoming messages and provide web development expertise"""
+        return self._cached_answer(message)
+    
+    def _answer(self, message: str) -> str:
+        """Pick the web development response for a message"""
         
-        message_lower = message.lower()
+        found = self._matcher.find(message)
         
         # Handle domain-specific questions
-        if "react" in message_lower and ("optimize" in message_lower or "performance" in message_lower):
-            return f"💻 Web Dev Expert ({self.structure_type}): {self.knowledge_base['react_optimization']}"
+        if "react" in found and ("optimize" in found or "performance" in found):
+            return self._responses['react_optimization']
         
-        elif "serverless" in message_lower or "serverless architecture" in message_lower:
-            return f"💻 Web Dev Expert ({self.structure_type}): {self.knowledge_base['serverless_architecture']}"
+        elif "serverless" in found or "serverless architecture" in found:
+            return self._responses['serverless_architecture']
         
-        elif "security" in message_lower and ("api" in message_lower or "restful" in message_lower):
-            return f"💻 Web Dev Expert ({self.structure_type}): {self.knowledge_base['api_security']}"
+        elif "security" in found and ("api" in found or "restful" in found):
+            return self._responses['api_security']
         
-        elif "ci/cd" in message_lower or "continuous integration" in message_lower or "deployment" in message_lower:
-            return f"💻 Web Dev Expert ({self.structure_type}): {self.knowledge_base['cicd_webapp']}"
+        elif "ci/cd" in found or "continuous integration" in found or "deployment" in found:
+            return self._responses['cicd_webapp']
         
-        elif "state management" in message_lower or ("state" in message_lower and "front" in message_lower):
-            return f"💻 Web Dev Expert ({self.structure_type}): {self.knowledge_base['state_management']}"
+        elif "state management" in found or ("state" in found and "front" in found):
+            return self._responses['state_management']
         
         # General web development response
-        elif any(keyword in message_lower for keyword in ["web", "frontend", "backend", "javascript", "react", "node", "api", "html", "css"]):
-            return f"💻 Web Dev Expert ({self.structure_type}): I specialize in full-stack web development. I can help with React, Node.js, API design, database integration, performance optimization, security, and deployment. What web development challenge are you facing?"
+        elif self.GENERAL_KEYWORDS & found:
+            return self._general_response
         
         # Default response
-        return f"💻 Web Dev Expert ({self.structure_type}): Hello! I'm a full-stack web development specialist. I can help with modern JavaScript frameworks, server-side development, API architecture, and deployment strategies. How can I assist with your web development project?"
+        return self._default_response
 
 def main():
     """Main function to run the web development agent"""
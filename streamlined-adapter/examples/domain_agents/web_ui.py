@@ -6,15 +6,47 @@ Simple web interface for interacting with the intelligent report agent.
 """
 
 from flask import Flask, render_template, request, jsonify, send_from_directory
-import requests
+import httpx
 import os
-from datetime import datetime
+import sys
+import threading
+import time
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+try:
+    from waitress import serve
+    HAS_WAITRESS = True
+except ImportError:
+    HAS_WAITRESS = False
+
+# Add parent directory to path to import nanda_core
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from nanda_core.utils import OrjsonProvider, TTLCache
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configuration
 AGENT_URL = os.getenv("AGENT_URL", "http://localhost:6003")
 
+# One pooled client for the process so UI requests reuse connections to the agent
+agent_client = httpx.Client(
+    base_url=AGENT_URL,
+    http2=HAS_H2,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=60.0
+)
+
+# Browser tabs poll /api/health; serve the last upstream result for a couple of
+# seconds and let only one request at a time refresh it
+HEALTH_CACHE = TTLCache(maxsize=1, ttl=2.0)
+health_lock = threading.Lock()
+
 @app.route('/')
 def index():
     """Serve the main page"""
@@ -24,12 +56,13 @@ def index():
 def query_agent():
     """Proxy requests to the intelligent agent"""
     try:
-        user_message = request.json.get('message', '')
-        conversation_id = request.json.get('conversation_id', f"web-{datetime.now().timestamp()}")
+        payload = request.json
+        user_message = payload.get('message', '')
+        conversation_id = payload.get('conversation_id') or f"web-{time.time_ns()}"
         
         # Send to agent
-        response = requests.post(
-            f"{AGENT_URL}/a2a",
+        response = agent_client.post(
+            "/a2a",
             json={
                 "content": {
                     "text": user_message,
@@ -37,8 +70,7 @@ def query_agent():
                 },
                 "role": "user",
                 "conversation_id": conversation_id
-            },
-            timeout=60
+            }
         )
         
         if response.status_code == 200:
@@ -61,24 +93,44 @@ def query_agent():
             "error": str(e)
         }), 500
 
+def check_agent_health() -> tuple:
+    """Return (agent_healthy, http_status) from the agent's /health, cached briefly"""
+    result = HEALTH_CACHE.get("agent")
+    if result is not None:
+        return result
+    
+    with health_lock:
+        # Another request may have refreshed the entry while we waited
+        result = HEALTH_CACHE.get("agent")
+        if result is None:
+            try:
+                response = agent_client.get("/health", timeout=5)
+                result = (response.status_code == 200, 200)
+            except Exception:
+                result = (False, 503)
+            HEALTH_CACHE.set("agent", result)
+    return result
+
 @app.route('/api/health')
 def health():
     """Check agent health"""
-    try:
-        response = requests.get(f"{AGENT_URL}/health", timeout=5)
-        return jsonify({
-            "agent_healthy": response.status_code == 200,
-            "agent_url": AGENT_URL
-        })
-    except:
-        return jsonify({
-            "agent_healthy": False,
-            "agent_url": AGENT_URL
-        }), 503
+    agent_healthy, status = check_agent_health()
+    return jsonify({
+        "agent_healthy": agent_healthy,
+        "agent_url": AGENT_URL
+    }), status
 
 if __name__ == '__main__':
     port = int(os.getenv('WEB_UI_PORT', 5001))
     print(f"\n🌐 Starting NANDA Web UI on http://localhost:{port}")
     print(f"🤖 Connected to agent: {AGENT_URL}")
     print(f"\n📱 Open your browser to: http://localhost:{port}\n")
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    
+    # The Werkzeug dev server (reloader, debugger) only when DEV is set
+    if os.getenv('DEV'):
+        app.run(host='0.0.0.0', port=port, debug=True)
+    elif HAS_WAITRESS:
+        serve(app, host='0.0.0.0', port=port, threads=int(os.getenv('WEB_UI_THREADS', 16)))
+    else:
+        print("⚠️ waitress not installed; falling back to the threaded Flask server")
+        app.run(host='0.0.0.0', port=port, threaded=True)
\ No newline at end of file
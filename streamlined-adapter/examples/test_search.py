@@ -1,26 +1,33 @@
-from pymongo import MongoClient
 from dotenv import load_dotenv
 import os
+import sys
 
 load_dotenv()
 
-client = MongoClient(os.getenv('MONGODB_AGENTFACTS_URI'))
+# Add parent directory to path to import nanda_core
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from nanda_core.utils import get_mongo_client
+
+client = get_mongo_client(os.getenv('MONGODB_AGENTFACTS_URI'))
 db = client['nanda_agentfacts']
 collection = db['agents']  # type: ignore
 
-# Test the exact query that's failing
-results = list(collection.find(
+# Test the exact query that's failing; project only the printed fields so
+# embedding arrays aren't shipped back with each match; results stream off the cursor
+cursor = collection.find(
     {"$text": {"$search": "Warren Insights"}},
-    {"score": {"$meta": "textScore"}}
-).sort([("score", {"$meta": "textScore"})]).limit(5))
-
-print(f"📊 Found {len(results)} results\n")
+    {"score": {"$meta": "textScore"}, "agent_name": 1, "agent_id": 1, "_id": 0}
+).sort([("score", {"$meta": "textScore"})]).limit(5).batch_size(5)
 
-for i, result in enumerate(results, 1):
+found = 0
+for i, result in enumerate(cursor, 1):
+    found = i
     print(f"{i}. Type: {type(result)}")
     if isinstance(result, dict):
         print(f"   Agent Name: {result.get('agent_name')}")
         print(f"   Agent ID: {result.get('agent_id')}")
     else:
         print(f"   ERROR: Expected dict, got {type(result)}: {result}")
-    print()
\ No newline at end of file
+    print()
+
+print(f"📊 Found {found} results")
\ No newline at end of file
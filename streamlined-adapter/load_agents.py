@@ -1,8 +1,11 @@
+import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
 
 # Load environment variables
 env_path = Path('.') / '.env'
@@ -15,16 +18,53 @@ if not agentfacts_uri:
     print("❌ ERROR: MONGODB_AGENTFACTS_URI not found in .env file!")
     exit(1)
 
-from nanda_core.embeddings.embedding_manager import create_embedding
+from nanda_core.embeddings.embedding_manager import create_batch_embeddings, create_embedding
+from nanda_core.embeddings.quantization import pack_embedding, quantize_embedding
+from nanda_core.utils import get_mongo_client
 
 # Connect directly to MongoDB
 print("🔌 Connecting to MongoDB...")
-client = MongoClient(agentfacts_uri)
+client = get_mongo_client(agentfacts_uri)
 db = client['nanda_agentfacts']
 collection = db['agents']
 
 print(f"✅ Connected! Database: {db.name}")
 
+# Texts per embedding call; each embedded batch becomes one insert_many round-trip
+EMBED_BATCH_SIZE = 64
+
+# "float32" (default, lossless, 4 bytes per dimension) or "int8" (opt-in, ~1 byte per
+# dimension; lossy, similarity scores shift slightly against the original vectors)
+EMBEDDING_STORAGE = os.getenv('EMBEDDING_STORAGE', 'float32')
+
+
+def content_hash(agent):
+    """Hash of an agent record as loaded from the config, plus the storage format of its embedding"""
+    source = json.dumps(agent, sort_keys=True, separators=(',', ':')) + EMBEDDING_STORAGE
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def insert_batch(batch):
+    """Upsert one batch unordered so a bad document doesn't stop the rest; returns the count written"""
+    # Keyed on agent_id, so re-runs refresh existing agents instead of duplicating them
+    operations = []
+    for agent in batch:
+        update = {'$set': agent}
+        if 'embedding_scale' not in agent:
+            # Drop the scale left by an earlier int8 run so the vector isn't read as quantized
+            update['$unset'] = {'embedding_scale': ''}
+        operations.append(UpdateOne({'agent_id': agent['agent_id']}, update, upsert=True))
+    try:
+        result = collection.bulk_write(operations, ordered=False)
+        inserted, updated = result.upserted_count, result.matched_count
+    except BulkWriteError as e:
+        inserted, updated = e.details.get('nUpserted', 0), e.details.get('nMatched', 0)
+        for error in e.details.get('writeErrors', []):
+            print(f"   ❌ Error writing {batch[error['index']].get('agent_id')}: {error.get('errmsg')}")
+    print(f"💾 Wrote batch of {len(batch)} agents: {inserted} new, {updated} updated")
+    return inserted + updated
+
+
 # Config file
 config_file = 'scripts/agent_configs/100-agents-config.json'
 
@@ -59,38 +99,106 @@ try:
     print(json.dumps(all_agents[0], indent=2))
     print("\n" + "="*50 + "\n")
     
-    # Add each agent with embeddings
-    loaded_count = 0
+    # agent_id is the upsert key; the unique index lets the server reject duplicates cheaply
+    try:
+        collection.create_index('agent_id', unique=True)
+    except OperationFailure as e:
+        print(f"⚠️  Could not create unique agent_id index (duplicates may already exist): {e}")
+    
+    # Agents whose stored document came from identical input are neither re-embedded nor rewritten
+    stored_hashes = {
+        doc['agent_id']: doc.get('content_hash')
+        for doc in collection.find({}, {'agent_id': 1, 'content_hash': 1, '_id': 0})
+    }
+    
+    # Collect embedding texts, embed them in batches, then write in bulk.
+    # Progress is reported per batch; per-agent problems are summarized at the end.
+    pending = []
+    skipped = []
+    missing_id = []
+    unchanged = 0
     for i, agent in enumerate(all_agents, 1):
+        # agent_id is the upsert key; without one every such record would overwrite the same document
+        if not agent.get('agent_id'):
+            missing_id.append(str(agent.get('agent_name') or f"agent #{i}"))
+            continue
+        
+        agent['content_hash'] = content_hash(agent)
+        if stored_hashes.get(agent['agent_id']) == agent['content_hash']:
+            unchanged += 1
+            continue
+        
+        # Create embedding text
+        specialization = agent.get('specialization', '')
+        description = agent.get('description', '')
+        domain = agent.get('domain', '')
+        embedding_text = f"{domain} {specialization} {description}".strip()
+        
+        if not embedding_text:
+            skipped.append(agent.get('agent_id', f"agent-{i}"))
+            continue
+        pending.append((agent, embedding_text))
+    
+    if unchanged:
+        print(f"⏭️  {unchanged} agents unchanged since the last load")
+    if missing_id:
+        print(f"⚠️  Skipping {len(missing_id)} agents with no agent_id: {', '.join(missing_id)}")
+    if skipped:
+        print(f"⚠️  Skipping {len(skipped)} agents with no text to embed: {', '.join(skipped)}")
+    
+    # A writer thread inserts each embedded batch while the next one is being embedded
+    writer = ThreadPoolExecutor(max_workers=1)
+    inserts = []
+    for start in range(0, len(pending), EMBED_BATCH_SIZE):
+        batch = pending[start:start + EMBED_BATCH_SIZE]
+        print(f"🔨 Creating embeddings {start + 1}-{start + len(batch)} of {len(pending)}...")
         try:
-            agent_id = agent.get('agent_id', f"agent-{i}")
-            agent_name = agent.get('agent_name', agent_id)
-            
-            print(f"⚙️  [{i}/{len(all_agents)}] Processing: {agent_name}")
-            
-            # Create embedding text
-            specialization = agent.get('specialization', '')
-            description = agent.get('description', '')
-            domain = agent.get('domain', '')
-            embedding_text = f"{domain} {specialization} {description}".strip()
-            
-            if not embedding_text:
-                print(f"   ⚠️  No text found for embedding, skipping...")
-                continue
-            
-            # Create embedding
-            print(f"   🔨 Creating embedding...")
-            agent['embedding'] = create_embedding(embedding_text)
-            
-            # Insert into MongoDB
-            result = collection.insert_one(agent)
-            loaded_count += 1
-            print(f"   ✅ Added successfully!")
-            
+            embeddings = create_batch_embeddings([text for _, text in batch])
         except Exception as e:
-            print(f"   ❌ Error: {e}")
+            # Retry one by one so a single bad text only drops its own agent
+            print(f"   ⚠️  Batch embedding failed ({e}), falling back to single requests")
+            embeddings = []
+            failed = []
+            for agent, text in batch:
+                try:
+                    embeddings.append(create_embedding(text))
+                except Exception as e:
+                    failed.append(f"{agent.get('agent_id')} ({e})")
+                    embeddings.append(None)
+            if failed:
+                print(f"   ❌ {len(failed)} agents could not be embedded: {'; '.join(failed)}")
+        
+        to_insert = []
+        for (agent, _), embedding in zip(batch, embeddings):
+            if embedding is not None:
+                # Stored as a binary vector, not a BSON array of doubles
+                if EMBEDDING_STORAGE == 'float32':
+                    agent['embedding'] = pack_embedding(embedding)
+                else:
+                    # Lossy: int8 codes plus one scale per vector, only when EMBEDDING_STORAGE=int8
+                    agent['embedding'], agent['embedding_scale'] = quantize_embedding(embedding)
+                to_insert.append(agent)
+        if to_insert:
+            inserts.append(writer.submit(insert_batch, to_insert))
+    
+    loaded_count = sum(future.result() for future in inserts)
+    writer.shutdown()
+    
+    print(f"\n🎉 Successfully loaded {loaded_count}/{len(all_agents)} agents ({unchanged} already up to date)!")
+    
+    # Covers distinct('group') and the per-group sample lookups below
+    collection.create_index([('group', 1), ('agent_id', 1)])
     
-    print(f"\n🎉 Successfully loaded {loaded_count}/{len(all_agents)} agents!")
+    # Weighted text index for name/specialization/description search
+    try:
+        collection.create_index(
+            [('agent_name', 'text'), ('specialization', 'text'), ('description', 'text')],
+            weights={'agent_name': 10, 'specialization': 5, 'description': 1},
+            name='agent_text_search'
+        )
+        print("✅ Text search index ready")
+    except OperationFailure as e:
+        print(f"⚠️  Could not create text index (a different one may exist): {e}")
     
     # Verify
     count = collection.count_documents({})
@@ -6,12 +6,35 @@ Simple, clean adapter focused on A2A communication without complexity.
 8-10 lines to deploy an agent.
 """
 
+import ast
+import operator
 import os
-import requests
-from typing import Optional, Callable
-from python_a2a import run_server
+from functools import lru_cache
+from typing import Optional, Callable, Iterable
 from .agent_bridge import SimpleAgentBridge
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+@lru_cache(maxsize=1)
+def registry_session():
+    """Keep-alive session for registry calls; connection failures are retried with backoff"""
+    # Imported here so agents that never register don't pay for requests at startup
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                          max_retries=Retry(total=3, backoff_factor=0.2))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class NANDA:
     """Simple NANDA class for clean agent deployment"""
@@ -26,7 +49,8 @@ class NANDA:
                  enable_telemetry: bool = True,
                  agent_name: Optional[str] = None,
                  agent_description: Optional[str] = None,
-                 agent_capabilities: Optional[dict] = None):
+                 agent_capabilities: Optional[dict] = None,
+                 agent_logic_stream: Optional[Callable[[str, str], Iterable[str]]] = None):
         """
         Create a simple NANDA agent
         
@@ -38,6 +62,8 @@ class NANDA:
             public_url: Public URL for agent registration (e.g., https://yourdomain.com:6000)
             host: Host to bind to
             enable_telemetry: Enable telemetry logging (optional)
+            agent_logic_stream: Optional generator variant of agent_logic yielding response chunks,
+                served on the A2A /stream endpoint
         """
         self.agent_id = agent_id
         self.agent_logic = agent_logic
@@ -61,14 +87,7 @@ class NANDA:
             except ImportError:
                 print(f"⚠️ Telemetry requested but module not available")
         
-
-        # Create the bridge with optional features
-
-# Extract metadata for agent card
-        agent_name = getattr(self, 'agent_name', agent_id)
-        agent_description = getattr(self, 'agent_description', 'A2A-compatible agent')
-        agent_capabilities = getattr(self, 'agent_capabilities', {})
-
+        # Create the bridge with optional features; metadata feeds the agent card
         self.bridge = SimpleAgentBridge(
             agent_id=agent_id,
             agent_logic=agent_logic,
@@ -77,8 +96,9 @@ class NANDA:
             public_url=self.public_url,
             name=agent_name or agent_id,
             description=agent_description or 'A2A-compatible agent',
-            capabilities=agent_capabilities or {}
-)
+            capabilities=agent_capabilities or {},
+            agent_logic_stream=agent_logic_stream
+        )
         
         print(f"🤖 NANDA Agent '{agent_id}' created")
         if registry_url:
@@ -95,6 +115,7 @@ class NANDA:
         print(f"🚀 Starting agent '{self.agent_id}' on {self.host}:{self.port}")
         
         # Start the A2A server
+        from python_a2a import run_server
         run_server(self.bridge, host=self.host, port=self.port)
     
     def _register(self):
@@ -121,7 +142,13 @@ class NANDA:
                 if 'tags' in self.metadata:
                     data['tags'] = self.metadata['tags']
                     
-            response = requests.post(f"{self.registry_url}/register", json=data, timeout=10)
+            url = f"{self.registry_url}/register"
+            session = registry_session()
+            if HAS_ORJSON:
+                response = session.post(url, data=orjson.dumps(data), timeout=10,
+                                        headers={"Content-Type": "application/json"})
+            else:
+                response = session.post(url, json=data, timeout=10)
             if response.status_code == 200:
                 print(f"✅ Agent '{self.agent_id}' registered successfully with metadata")
             else:
@@ -140,6 +167,36 @@ class StreamlinedAdapter(NANDA):
     pass
 
 
+# Operators helpful_agent can evaluate; anything else in the expression is rejected
+ARITHMETIC_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _evaluate_node(node):
+    """Evaluate a whitelisted arithmetic AST node"""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in ARITHMETIC_OPS:
+        return ARITHMETIC_OPS[type(node.op)](_evaluate_node(node.left), _evaluate_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in ARITHMETIC_OPS:
+        return ARITHMETIC_OPS[type(node.op)](_evaluate_node(node.operand))
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+@lru_cache(maxsize=1024)
+def evaluate_arithmetic(expression: str):
+    """Safely evaluate a + - * / // % expression (no names, calls or attribute access)"""
+    return _evaluate_node(ast.parse(expression.strip(), mode="eval").body)
+
+
 # Example agent logic functions
 def echo_agent(message: str, conversation_id: str) -> str:
     """Simple echo agent"""
@@ -160,7 +217,7 @@ def helpful_agent(message: str, conversation_id: str) -> str:
         return "I can help with time, calculations, and general questions!"
     elif any(op in message for op in ['+', '-', '*', '/']):
         try:
-            result = eval(message.replace('x', '*').replace('X', '*'))
+            result = evaluate_arithmetic(message.replace('x', '*').replace('X', '*'))
             return f"Result: {result}"
         except:
             return "Invalid calculation"
@@ -5,17 +5,123 @@ Enhanced Agent Bridge for A2A Communication with Semantic Search
 Clean bridge with telemetry, semantic search, and agent discovery.
 """
 
+import asyncio
+import inspect
 import os
+import queue
+import re
+import threading
 import uuid
+import hashlib
+import itertools
 import logging
-import requests
 import time
-from typing import Callable, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, Any, Iterable
+from flask import Response, g, has_request_context, request
 from python_a2a import A2AServer, A2AClient, Message, TextContent, MessageRole, Metadata
+from ..utils.cache import TTLCache
+from ..utils.json_provider import OrjsonProvider
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    HAS_HTTPX = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
 
 # Configure logger to capture conversation logs
 logger = logging.getLogger(__name__)
 
+# Binary encoding accepted on the message endpoints for internal agent-to-agent calls
+MSGPACK_MIMETYPE = "application/msgpack"
+
+AGENT_CARD_PATHS = ("/agent.json", "/a2a/agent.json", "/.well-known/agent.json")
+BROWSER_AGENTS = ("mozilla", "chrome", "safari", "edge")
+
+# Fallback addresses for local testing when the registry doesn't know an agent
+LOCAL_AGENTS = MappingProxyType({
+    "test_agent": "http://localhost:6000",
+    "pirate_agent": "http://localhost:6001",
+    "helpful_agent": "http://localhost:6002",
+    "echo_agent": "http://localhost:6003",
+    "simple_test_agent": "http://localhost:6005",
+    "agent_alpha": "http://localhost:6010",
+    "agent_beta": "http://localhost:6011"
+})
+
+# Handler for messages by first character; anything else goes straight to agent_logic
+MESSAGE_ROUTES = {
+    "?": "_route_search",
+    "F": "_route_agent_frame",
+    "@": "_route_mention",
+    "/": "_route_command"
+}
+
+# Framed agent-to-agent message: FROM / TO lines, then the message body
+AGENT_MESSAGE_RE = re.compile(r"FROM:([^\n]*)\nTO:([^\n]*)\nMESSAGE:(.*)", re.DOTALL)
+
+# "Response to <agent_id>: <body>" reply to a message we sent; matches any "Response to " prefix
+AGENT_REPLY_RE = re.compile(r"Response to (?:([^:\n]*): )?(.*)", re.DOTALL)
+
+# agent_logic calls allowed in flight at once, and how long a request waits for one
+AGENT_LOGIC_CONCURRENCY = int(os.getenv("AGENT_LOGIC_CONCURRENCY", "16"))
+AGENT_LOGIC_TIMEOUT = float(os.getenv("AGENT_LOGIC_TIMEOUT", "120"))
+
+# Memoized replies for deterministic agent_logic; longer prompts are never cached
+RESPONSE_CACHE_TTL = 300
+RESPONSE_CACHE_MAX_PROMPT = 4096
+
+# Seconds a discovery result is reused for the same (normalized) search
+SEARCH_CACHE_TTL = 30
+
+# BRIDGE_WARMUP=1 runs a throwaway search (and pure agent_logic) at startup so model
+# loading and first-call setup don't land on the first user's request
+BRIDGE_WARMUP = os.getenv("BRIDGE_WARMUP", "0") in ("1", "true", "TRUE", "yes")
+
+# Upper bound on concurrent outbound calls for one @@ broadcast
+MAX_BROADCAST_WORKERS = 32
+
+# "@@a,b message" / "@@a, b message": comma-separated targets (spaces allowed around commas), then the message
+BROADCAST_RE = re.compile(r"@@((?:[^\s,]+\s*,\s*)*[^\s,]+)\s+(.*)", re.DOTALL)
+
+# Seconds to remember agent URLs; unknown agents are retried sooner
+LOOKUP_TTL = 60
+LOOKUP_MISS_TTL = 10
+
+
+# Reply ids keep the UUID4 layout: a random per-process prefix (version and variant bits
+# included) plus a 48-bit counter. str(uuid.uuid4()) costs a urandom syscall and a UUID
+# object per reply, over half of building the reply Message.
+_MESSAGE_ID_PREFIX = str(uuid.uuid4())[:24]
+_message_counter = itertools.count(int.from_bytes(os.urandom(4), "big"))
+
+
+def next_message_id() -> str:
+    """Unique id for a reply Message"""
+    return f"{_MESSAGE_ID_PREFIX}{next(_message_counter) & 0xFFFFFFFFFFFF:012x}"
+
 
 class SimpleAgentBridge(A2AServer):
     """Enhanced Agent Bridge with semantic search and telemetry"""
@@ -28,13 +134,69 @@ class SimpleAgentBridge(A2AServer):
                  public_url: Optional[str] = None, 
                  name = None,
                  description = None,
-                 capabilities = None):
+                 capabilities = None,
+                 agent_logic_stream: Optional[Callable[[str, str], Iterable[str]]] = None,
+                 cache_responses: Optional[bool] = None):
         # Pass through URL to the A2A server so it can build the default agent card
         super().__init__(url=public_url,name = name or 'A2A Agent',description = description or 'A2A Agent', capabilities = capabilities or {})  # type: ignore[arg-type]
         self.agent_id = agent_id
+        # Every reply is "[agent_id] text"; build the constant part once
+        self._reply_prefix = f"[{agent_id}] "
         self.agent_logic = agent_logic
+        # agent_logic may be a plain function or an async def (e.g. an LLM client call)
+        self._agent_logic_is_async = inspect.iscoroutinefunction(agent_logic)
+        # Bounds concurrent backend (e.g. LLM) calls however many request threads the server runs.
+        # Coroutine logic shares one long-lived event loop instead of a new loop per message.
+        self._logic_pool = None
+        self._logic_loop = None
+        self._logic_slots = None  # asyncio.Semaphore, created on the logic loop
+        if self._agent_logic_is_async:
+            self._logic_loop = asyncio.new_event_loop()
+            threading.Thread(target=self._logic_loop.run_forever, name=f"{agent_id}-logic-loop",
+                             daemon=True).start()
+        else:
+            self._logic_pool = ThreadPoolExecutor(max_workers=AGENT_LOGIC_CONCURRENCY,
+                                                  thread_name_prefix=f"{agent_id}-logic")
+        # Timed-out sync calls can't be interrupted and hold their worker until they return
+        self._stuck_logic = 0
+        self._stuck_lock = threading.Lock()
+        self.agent_logic_stream = agent_logic_stream
+        # Opt-in (flag or agent_logic.cacheable = True) for logic whose reply depends only on the text
+        if cache_responses is None:
+            cache_responses = getattr(agent_logic, "cacheable", False)
+        self._response_cache = TTLCache(maxsize=2048, ttl=RESPONSE_CACHE_TTL) if cache_responses else None
+        # Optional agent_logic.etag_key(reply) -> text to hash, for replies carrying volatile fields
+        self._etag_key = getattr(agent_logic, "etag_key", None)
+        self._agent_card_json = None
         self.registry_url = registry_url
         self.telemetry = telemetry
+        # Telemetry calls are queued and written by a background thread, off the reply path
+        self._telemetry_queue = queue.SimpleQueue()
+        if telemetry:
+            threading.Thread(target=self._drain_telemetry, name=f"{agent_id}-telemetry", daemon=True).start()
+        
+        # Keep-alive connections for registry lookups; over HTTPS, HTTP/2 multiplexes
+        # concurrent lookups (bulk prefetch, broadcasts) on one connection
+        if HAS_HTTPX:
+            self._http = httpx.Client(timeout=10.0, transport=httpx.HTTPTransport(
+                http2=HAS_H2, retries=2,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=128)))
+        else:
+            self._http = requests.Session()
+            http_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128,
+                                       max_retries=Retry(total=2, backoff_factor=0.1))
+            self._http.mount("http://", http_adapter)
+            self._http.mount("https://", http_adapter)
+        # A2AClient fetches the peer's agent card on construction, so reuse one per URL
+        self._a2a_clients = TTLCache(maxsize=256, ttl=300)
+        # agent_id -> URL (or None when not found), cleared by /flush
+        self._lookup_cache = TTLCache(maxsize=1024, ttl=LOOKUP_TTL)
+        # Cleared the first time the registry rejects POST /lookup
+        self._bulk_lookup_supported = True
+        # (query, structure, limit, min_score) -> DiscoveryResult; details are still fetched per reply
+        self._search_cache = TTLCache(maxsize=512, ttl=SEARCH_CACHE_TTL)
+        # Off-request work such as prefetching lookups for search results
+        self._background = ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"{agent_id}-bg")
         
         # Initialize discovery system if registry is available
         self.discovery = None
@@ -49,6 +211,93 @@ class SimpleAgentBridge(A2AServer):
             except ImportError as e:
                 print(f"⚠️ Discovery system not available: {e}")
         
+        if BRIDGE_WARMUP:
+            self._background.submit(self._warmup)
+        
+    def _warmup(self):
+        """Exercise discovery and (cacheable, hence side-effect free) agent_logic once"""
+        start = time.time()
+        try:
+            if self.discovery:
+                self.discovery.discover_agents("warmup", limit=1, min_score=0.0)
+            if self._response_cache is not None:
+                self._call_agent_logic("warmup", "warmup")
+            logger.info(f"🔥 [{self.agent_id}] Warm-up finished in {time.time() - start:.2f}s")
+        except Exception as e:
+            logger.warning(f"🔥 [{self.agent_id}] Warm-up failed: {e}")
+    
+    def setup_routes(self, app):
+        """Register the A2A routes plus a msgpack fast path for agent-to-agent messages"""
+        super().setup_routes(app)
+        # Every jsonify() in the A2A handlers (messages, tasks, agent card) encodes with orjson
+        app.json = OrjsonProvider(app)
+        
+        @app.before_request
+        def serve_cached_agent_card():
+            # The card is static once the server is up: serialize it on first request and
+            # hand API clients the same bytes afterwards (browsers still get the HTML view)
+            if request.method != "GET" or request.path not in AGENT_CARD_PATHS:
+                return None
+            user_agent = request.headers.get("User-Agent", "").lower()
+            if not (request.args.get("format", "") == "json"
+                    or "application/json" in request.headers.get("Accept", "")
+                    or not any(browser in user_agent for browser in BROWSER_AGENTS)
+                    or "python" in user_agent or "requests" in user_agent):
+                return None
+            if self._agent_card_json is None:
+                card = self.agent_card.to_dict()
+                card.setdefault("capabilities", {})
+                card["capabilities"]["google_a2a_compatible"] = self._use_google_a2a
+                card["capabilities"]["parts_array_format"] = self._use_google_a2a
+                # Peers read this before sending msgpack-encoded messages
+                card["capabilities"]["msgpack"] = HAS_MSGPACK
+                self._agent_card_json = app.json.response(card).get_data()
+            return Response(self._agent_card_json, mimetype="application/json")
+        
+        @app.after_request
+        def add_etag(response):
+            # Tag replies with a hash of the agent's text (message ids differ on every
+            # response) so callers can send If-None-Match and skip unchanged bodies
+            if (request.method != "POST" or request.path not in ("/", "/a2a")
+                    or response.status_code != 200 or "a2a_response_text" not in g):
+                return response
+            text = g.a2a_response_text
+            if self._etag_key is not None:
+                try:
+                    text = self._etag_key(text)
+                except Exception as e:
+                    logger.warning(f"🏷️ [{self.agent_id}] etag_key failed, hashing the full reply: {e}")
+            etag = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+            if request.if_none_match.contains(etag):
+                not_modified = Response(status=304)
+                not_modified.set_etag(etag)
+                return not_modified
+            response.set_etag(etag)
+            return response
+        
+        @app.before_request
+        def handle_msgpack_message():
+            # JSON requests fall through to the regular python_a2a handlers
+            if (request.method != "POST" or request.path not in ("/", "/a2a")
+                    or request.mimetype != MSGPACK_MIMETYPE):
+                return None
+            if not HAS_MSGPACK:
+                # Rejected before processing, so the sender can safely resend as JSON
+                return Response(status=415)
+            
+            try:
+                data = msgpack.unpackb(request.get_data(), raw=False)
+                if "parts" in data and "role" in data and "content" not in data:
+                    message = Message.from_google_a2a(data)
+                else:
+                    message = Message.from_dict(data)
+                response = self.handle_message(message)
+                body = response.to_google_a2a() if self._use_google_a2a else response.to_dict()
+                return Response(msgpack.packb(body), mimetype=MSGPACK_MIMETYPE)
+            except Exception as e:
+                error = {"content": {"type": "error", "message": f"Error processing message: {str(e)}"}, "role": "system"}
+                return Response(msgpack.packb(error), status=500, mimetype=MSGPACK_MIMETYPE)
+    
     def handle_message(self, msg: Message) -> Message:
         """Handle incoming messages with enhanced features"""
         start_time = time.time()
@@ -56,7 +305,7 @@ class SimpleAgentBridge(A2AServer):
         
         # Log telemetry
         if self.telemetry:
-            self.telemetry.log_message_received(self.agent_id, conversation_id)
+            self._record_telemetry("log_message_received", self.agent_id, conversation_id)
         
         # Only handle text content
         if not isinstance(msg.content, TextContent):
@@ -67,35 +316,27 @@ class SimpleAgentBridge(A2AServer):
         
         user_text = msg.content.text.strip()
         
-        # Handle semantic search queries with '?' command
-        if user_text.startswith('?'):
-            return self._handle_search_query(user_text[1:].strip(), msg, conversation_id)
-        
-        # Check if this is an agent-to-agent message in our simple format
-        if user_text.startswith("FROM:") and "TO:" in user_text and "MESSAGE:" in user_text:
-            return self._handle_incoming_agent_message(user_text, msg, conversation_id)
-        
-        # Check for @agent-id mentions for A2A communication
-        if user_text.startswith("@") and " " in user_text:
-            return self._handle_agent_mention(user_text, msg, conversation_id)
+        # Search, agent frames, mentions and commands are picked by one dict probe on the
+        # first character; a route returning None hands the message to agent_logic
+        route = MESSAGE_ROUTES.get(user_text[:1])
+        if route is not None:
+            response = getattr(self, route)(user_text, msg, conversation_id)
+            if response is not None:
+                return response
         
         logger.info(f"📨 [{self.agent_id}] Received: {user_text}")
         
-        # Handle different message types
+        # Regular message - use agent logic
         try:
-            if user_text.startswith("@"):
-                # Agent-to-agent message (outgoing)
-                return self._handle_agent_message(user_text, msg, conversation_id)
-            elif user_text.startswith("/"):
-                # System command
-                return self._handle_command(user_text, msg, conversation_id)
+            cache = self._response_cache
+            if cache is None or len(user_text) > RESPONSE_CACHE_MAX_PROMPT:
+                response = self._call_agent_logic(user_text, conversation_id)
             else:
-                # Regular message - use agent logic
-                if self.telemetry:
-                    self.telemetry.log_message_received(self.agent_id, conversation_id)
-                
-                response = self.agent_logic(user_text, conversation_id)
-                return self._create_response(msg, conversation_id, response)
+                response = cache.get(user_text)
+                if response is None:
+                    response = self._call_agent_logic(user_text, conversation_id)
+                    cache.set(user_text, response)
+            return self._create_response(msg, conversation_id, response)
                 
         except Exception as e:
             return self._create_response(
@@ -103,38 +344,132 @@ class SimpleAgentBridge(A2AServer):
                 f"Error: {str(e)}"
             )
     
-    def _handle_incoming_agent_message(self, user_text: str, msg: Message, conversation_id: str) -> Message:
+    def _record_telemetry(self, method: str, *args, **kwargs):
+        """Queue a call to self.telemetry.<method> for the telemetry thread"""
+        self._telemetry_queue.put((method, args, kwargs))
+    
+    def _drain_telemetry(self):
+        """Telemetry thread: perform queued telemetry calls in order"""
+        while True:
+            method, args, kwargs = self._telemetry_queue.get()
+            try:
+                getattr(self.telemetry, method)(*args, **kwargs)
+            except Exception as e:
+                logger.warning(f"📊 Telemetry {method} failed: {e}")
+    
+    def _route_search(self, user_text: str, msg: Message, conversation_id: str) -> Message:
+        """'? query' - semantic agent search; '?! query' skips the search cache"""
+        if user_text.startswith("?!"):
+            return self._handle_search_query(user_text[2:].strip(), msg, conversation_id, use_cache=False)
+        return self._handle_search_query(user_text[1:].strip(), msg, conversation_id)
+    
+    def _route_agent_frame(self, user_text: str, msg: Message, conversation_id: str) -> Optional[Message]:
+        """FROM/TO/MESSAGE frame sent by another agent; other text starting with 'F' is a regular message"""
+        if user_text[:5] != "FROM:":
+            return None
+        match = AGENT_MESSAGE_RE.match(user_text)
+        if match is None:
+            return None
+        from_agent, _, message_content = (part.strip() for part in match.groups())
+        return self._handle_incoming_agent_message(from_agent, message_content, msg, conversation_id)
+    
+    def _route_mention(self, user_text: str, msg: Message, conversation_id: str) -> Message:
+        """'@agent message' mention, '@@a,b message' broadcast, or a malformed mention"""
+        if " " not in user_text:
+            logger.info(f"📨 [{self.agent_id}] Received: {user_text}")
+            return self._handle_agent_message(user_text, msg, conversation_id)
+        if user_text.startswith("@@"):
+            return self._handle_agent_broadcast(user_text, msg, conversation_id)
+        return self._handle_agent_mention(user_text, msg, conversation_id)
+    
+    def _route_command(self, user_text: str, msg: Message, conversation_id: str) -> Message:
+        """'/command args' - system command"""
+        logger.info(f"📨 [{self.agent_id}] Received: {user_text}")
+        return self._handle_command(user_text, msg, conversation_id)
+    
+    def _call_agent_logic(self, text: str, conversation_id: str) -> str:
+        """Run agent_logic, giving up after AGENT_LOGIC_TIMEOUT seconds"""
+        if self._agent_logic_is_async:
+            future = asyncio.run_coroutine_threadsafe(self._run_async_logic(text, conversation_id), self._logic_loop)
+            try:
+                return future.result(timeout=AGENT_LOGIC_TIMEOUT)
+            except FutureTimeoutError:
+                # Cancels the coroutine on the loop, so a timed-out call frees its slot
+                future.cancel()
+                raise TimeoutError(f"agent logic timed out after {AGENT_LOGIC_TIMEOUT:g}s")
+        
+        if self._stuck_logic >= AGENT_LOGIC_CONCURRENCY:
+            # Every worker is still busy with a call we already gave up on; fail fast instead of queueing
+            raise RuntimeError(f"agent logic overloaded: all {AGENT_LOGIC_CONCURRENCY} workers are "
+                               f"still running timed-out calls")
+        future = self._logic_pool.submit(self.agent_logic, text, conversation_id)
+        try:
+            return future.result(timeout=AGENT_LOGIC_TIMEOUT)
+        except FutureTimeoutError:
+            if not future.cancel():
+                with self._stuck_lock:
+                    self._stuck_logic += 1
+                future.add_done_callback(self._release_stuck_logic)
+                logger.warning(f"⏱️ [{self.agent_id}] agent logic timed out; {self._stuck_logic} "
+                               f"worker(s) still busy with timed-out calls")
+            raise TimeoutError(f"agent logic timed out after {AGENT_LOGIC_TIMEOUT:g}s")
+    
+    def _release_stuck_logic(self, future):
+        """A timed-out sync call finally returned and its worker is free again"""
+        with self._stuck_lock:
+            self._stuck_logic -= 1
+    
+    async def _run_async_logic(self, text: str, conversation_id: str) -> str:
+        """Await agent_logic on the logic loop, at most AGENT_LOGIC_CONCURRENCY at a time"""
+        if self._logic_slots is None:
+            self._logic_slots = asyncio.Semaphore(AGENT_LOGIC_CONCURRENCY)
+        async with self._logic_slots:
+            return await self.agent_logic(text, conversation_id)
+    
+    async def handle_message_async(self, msg: Message) -> Message:
+        """Awaitable handle_message for asyncio callers; the blocking work runs in a worker thread"""
+        return await asyncio.to_thread(self.handle_message, msg)
+    
+    async def stream_response(self, msg: Message):
+        """Stream regular messages through agent_logic_stream; everything else is answered in one chunk"""
+        user_text = msg.content.text.strip() if isinstance(msg.content, TextContent) else ""
+        
+        if (self.agent_logic_stream is None or not user_text
+                or user_text[0] in "?@/" or user_text.startswith("FROM:")):
+            # Lookups, agent calls and searches block, so keep them off the stream's event loop
+            yield (await self.handle_message_async(msg)).content.text
+            return
+        
+        conversation_id = msg.conversation_id or str(uuid.uuid4())
+        if self.telemetry:
+            self._record_telemetry("log_message_received", self.agent_id, conversation_id)
+        
+        logger.info(f"📨 [{self.agent_id}] Streaming: {user_text}")
+        
+        yield self._reply_prefix
+        try:
+            for chunk in self.agent_logic_stream(user_text, conversation_id):
+                yield chunk
+        except Exception as e:
+            yield f"Error: {str(e)}"
+    
+    def _handle_incoming_agent_message(self, from_agent: str, message_content: str, msg: Message, conversation_id: str) -> Message:
         """Handle incoming messages from other agents"""
         try:
-            lines = user_text.strip().split('\n')
-            from_agent = ""
-            to_agent = ""
-            message_content = ""
-            
-            for line in lines:
-                if line.startswith("FROM:"):
-                    from_agent = line[5:].strip()
-                elif line.startswith("TO:"):
-                    to_agent = line[3:].strip()
-                elif line.startswith("MESSAGE:"):
-                    message_content = line[8:].strip()
-            
             logger.info(f"📨 [{self.agent_id}] ← [{from_agent}]: {message_content}")
             
             # Check if this is a reply (don't respond to replies to avoid infinite loops)
-            if message_content.startswith("Response to "):
+            reply = AGENT_REPLY_RE.match(message_content)
+            if reply is not None:
                 logger.info(f"🔄 [{self.agent_id}] Received reply from {from_agent}, displaying to user")
                 # Display the reply to user but don't respond back to avoid loops
                 return self._create_response(
                     msg, conversation_id, 
-                    f"[{from_agent}] {message_content[len('Response to ' + self.agent_id + ': '):]}"
+                    f"[{from_agent}] {reply.group(2)}"
                 )
             
-            # Process the message through our agent logic
-            if self.telemetry:
-                self.telemetry.log_message_received(self.agent_id, conversation_id)
-            
-            response = self.agent_logic(message_content, conversation_id)
+            # Process the message through our agent logic (receipt was logged in handle_message)
+            response = self._call_agent_logic(message_content, conversation_id)
             
             # Send response back
             return self._create_response(
@@ -178,12 +513,27 @@ class SimpleAgentBridge(A2AServer):
 /help - Show this help
 /ping - Test agent responsiveness  
 /status - Show agent status
-@agent_id message - Send message to another agent"""
+/flush - Forget cached agent lookups and search results
+/cache_clear - Forget memoized replies
+@agent_id message - Send message to another agent
+@@agent1,agent2 message - Send message to several agents in parallel"""
             return self._create_response(msg, conversation_id, help_text)
         
         elif command == "ping":
             return self._create_response(msg, conversation_id, "Pong!")
         
+        elif command == "flush":
+            self._lookup_cache.clear()
+            self._a2a_clients.clear()
+            self._search_cache.clear()
+            return self._create_response(msg, conversation_id, "Agent lookup cache cleared")
+        
+        elif command == "cache_clear":
+            if self._response_cache is None:
+                return self._create_response(msg, conversation_id, "Response caching is not enabled")
+            self._response_cache.clear()
+            return self._create_response(msg, conversation_id, "Response cache cleared")
+        
         elif command == "status":
             status = f"Agent: {self.agent_id}, Status: Running"
             if self.registry_url:
@@ -214,7 +564,10 @@ class SimpleAgentBridge(A2AServer):
             simple_message = f"FROM: {self.agent_id}\nTO: {target_agent_id}\nMESSAGE: {message_text}"
             
             # Send message using A2A client
-            client = A2AClient(agent_url, timeout=30)
+            client = self._a2a_clients.get(agent_url)
+            if client is None:
+                client = A2AClient(agent_url, timeout=30)
+                self._a2a_clients.set(agent_url, client)
             response = client.send_message(
                 Message(
                     role=MessageRole.USER,
@@ -229,7 +582,7 @@ class SimpleAgentBridge(A2AServer):
             )
             
             if self.telemetry:
-                self.telemetry.log_agent_message_sent(self.agent_id, target_agent_id, conversation_id)
+                self._record_telemetry("log_message_sent", target_agent_id, conversation_id)
             
             # Extract the actual response content from the target agent
             logger.info(f"🔍 [{self.agent_id}] Response type: {type(response)}, has parts: {hasattr(response, 'parts') if response else 'None'}")
@@ -249,47 +602,86 @@ class SimpleAgentBridge(A2AServer):
             return f"❌ Error sending to {target_agent_id}: {str(e)}"
     
     def _lookup_agent(self, agent_id: str) -> Optional[str]:
-        """Look up agent URL in registry or use local discovery"""
+        """Look up agent URL in registry or use local discovery (cached for LOOKUP_TTL seconds)"""
+        cached = self._lookup_cache.get(agent_id, self._lookup_cache)
+        if cached is not self._lookup_cache:
+            return cached
         
         # Try registry lookup if available
+        cacheable = True
         if self.registry_url:
             try:
-                response = requests.get(f"{self.registry_url}/lookup/{agent_id}", timeout=10)
+                response = self._http.get(f"{self.registry_url}/lookup/{agent_id}", timeout=10)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = orjson.loads(response.content) if HAS_ORJSON else response.json()
                     agent_url = data.get("agent_url")
                     logger.info(f"🌐 Found {agent_id} in registry: {agent_url}")
+                    self._lookup_cache.set(agent_id, agent_url)
                     return agent_url
             except Exception as e:
                 logger.warning(f"🌐 Registry lookup failed: {e}")
+                # The registry being down says nothing about the agent, so don't cache
+                cacheable = False
         
         # Fallback to local discovery (for testing)
-        local_agents = {
-            "test_agent": "http://localhost:6000",
-            "pirate_agent": "http://localhost:6001", 
-            "helpful_agent": "http://localhost:6002",
-            "echo_agent": "http://localhost:6003",
-            "simple_test_agent": "http://localhost:6005",
-            "agent_alpha": "http://localhost:6010",
-            "agent_beta": "http://localhost:6011"
-        }
-        
-        if agent_id in local_agents:
-            logger.info(f"🏠 Found {agent_id} locally: {local_agents[agent_id]}")
-            return local_agents[agent_id]
-        
-        return None
+        agent_url = LOCAL_AGENTS.get(agent_id)
+        if agent_url:
+            logger.info(f"🏠 Found {agent_id} locally: {agent_url}")
+        if cacheable:
+            self._lookup_cache.set(agent_id, agent_url, ttl=None if agent_url else LOOKUP_MISS_TTL)
+        return agent_url
+    
+    def _lookup_agents_bulk(self, agent_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Resolve several agent URLs with one POST /lookup round-trip, priming the lookup cache"""
+        urls: Dict[str, Optional[str]] = {}
+        missing = []
+        for agent_id in dict.fromkeys(agent_ids):
+            cached = self._lookup_cache.get(agent_id, self._lookup_cache)
+            if cached is self._lookup_cache:
+                missing.append(agent_id)
+            else:
+                urls[agent_id] = cached
+        
+        if missing and self.registry_url and self._bulk_lookup_supported:
+            try:
+                response = self._http.post(f"{self.registry_url}/lookup", json={"ids": missing}, timeout=10)
+                if response.status_code in (404, 405):
+                    # Registry only serves /lookup/<agent_id>; stop trying the bulk route
+                    self._bulk_lookup_supported = False
+                elif response.status_code == 200:
+                    data = orjson.loads(response.content) if HAS_ORJSON else response.json()
+                    entries = data.get("agents", data)
+                    for agent_id in missing:
+                        entry = entries.get(agent_id)
+                        agent_url = entry.get("agent_url") if isinstance(entry, dict) else entry
+                        if not agent_url:
+                            agent_url = LOCAL_AGENTS.get(agent_id)
+                        self._lookup_cache.set(agent_id, agent_url, ttl=None if agent_url else LOOKUP_MISS_TTL)
+                        urls[agent_id] = agent_url
+                    return urls
+            except Exception as e:
+                logger.warning(f"🌐 Bulk registry lookup failed: {e}")
+        
+        for agent_id in missing:
+            urls[agent_id] = self._lookup_agent(agent_id)
+        return urls
     
     def _create_response(self, original_msg: Message, conversation_id: str, text: str) -> Message:
         """Create a response message"""
+        if type(text) is not str:
+            text = str(text)
+        if has_request_context():
+            g.a2a_response_text = text
         return Message(
             role=MessageRole.AGENT,
-            content=TextContent(text=f"[{self.agent_id}] {text}"),
+            content=TextContent(text=self._reply_prefix + text),
+            message_id=next_message_id(),
             parent_message_id=original_msg.message_id,
             conversation_id=conversation_id
         )
     
-    def _handle_search_query(self, query: str, original_msg: Message, conversation_id: str) -> Message:
+    def _handle_search_query(self, query: str, original_msg: Message, conversation_id: str,
+                             use_cache: bool = True) -> Message:
         """Handle semantic search queries with '?' command"""
         if not self.discovery:
             return self._create_response(
@@ -302,6 +694,7 @@ class SimpleAgentBridge(A2AServer):
                 original_msg, conversation_id,
                 "🔍 Usage: ? <search query>\n"
                 "🔍 Structure-specific: ?keywords <query> | ?description <query> | ?embedding <query>\n"
+                "🔍 Fresh results (skip the search cache): ?! <query>\n"
                 "Example: ? Find me a data scientist\n"
                 "Example: ?keywords python expert\n"
                 "Example: ?description data analysis specialist"
@@ -324,11 +717,20 @@ class SimpleAgentBridge(A2AServer):
                 query = query[10:].strip()
             
             # Perform agent discovery (with optional structure filtering)
-            result = self.discovery.discover_agents(query, limit=5, min_score=0.3, structure_type=structure_type)
+            cache_key = (" ".join(query.lower().split()), structure_type, 5, 0.3)
+            result = self._search_cache.get(cache_key) if use_cache else None
+            if result is None:
+                result = self.discovery.discover_agents(query, limit=5, min_score=0.3, structure_type=structure_type)
+                self._search_cache.set(cache_key, result)
+            
+            # Resolve the recommended agents' URLs in the background so a follow-up @mention is a cache hit
+            if self.registry_url and result.recommended_agents:
+                self._background.submit(self._lookup_agents_bulk,
+                                        [agent.agent_id for agent in result.recommended_agents])
             
             search_time = time.time() - search_start
             if self.telemetry:
-                self.telemetry.log_agent_discovery(query, len(result.recommended_agents), search_time)
+                self._record_telemetry("log_agent_discovery", query, len(result.recommended_agents), search_time)
             
             # Prepare data for structured telemetry
             top_agents = []
@@ -359,40 +761,44 @@ class SimpleAgentBridge(A2AServer):
             
             # Format response
             if not result.recommended_agents:
-                response_text = f"🔍 No agents found for: '{query}'\n\n"
-                response_text += "💡 Suggestions:\n"
-                for suggestion in result.suggestions[:3]:
-                    response_text += f"  • {suggestion}\n"
+                lines = [f"🔍 No agents found for: '{query}'", "", "💡 Suggestions:"]
+                lines.extend(f"  • {suggestion}" for suggestion in result.suggestions[:3])
+                lines.append("")
             else:
                 structure_info = f" ({structure_type} structure)" if structure_type else ""
-                response_text = f"🔍 Found {len(result.recommended_agents)} agents{structure_info} for: '{query}'\n\n"
+                lines = [f"🔍 Found {len(result.recommended_agents)} agents{structure_info} for: '{query}'", ""]
+                
+                # Fetch every agent's details concurrently instead of one registry call after another
+                agent_ids = [agent_score.agent_id for agent_score in result.recommended_agents]
+                with ThreadPoolExecutor(max_workers=len(agent_ids)) as pool:
+                    details = list(pool.map(self.discovery.get_agent_details, agent_ids))
                 
-                for i, agent_score in enumerate(result.recommended_agents, 1):
-                    response_text += f"{i}. @{agent_score.agent_id} (Score: {agent_score.score:.2f})\n"
+                for i, (agent_score, agent_data) in enumerate(zip(result.recommended_agents, details), 1):
+                    lines.append(f"{i}. @{agent_score.agent_id} (Score: {agent_score.score:.2f})")
                     
-                    # Try to get detailed agent data
-                    agent_data = self.discovery.get_agent_details(agent_score.agent_id)
                     if agent_data:
-                        response_text += f"   📋 {agent_data.get('description', 'No description')}\n"
+                        lines.append(f"   📋 {agent_data.get('description', 'No description')}")
                         capabilities = agent_data.get('capabilities', [])
                         if capabilities:
-                            response_text += f"   🏷️ {', '.join(capabilities[:3])}\n"
+                            lines.append(f"   🏷️ {', '.join(capabilities[:3])}")
                     else:
-                        response_text += f"   📋 Agent available in registry\n"
+                        lines.append("   📋 Agent available in registry")
                     
                     # Show match reasons if available
                     if agent_score.match_reasons:
-                        response_text += f"   ✅ {agent_score.match_reasons[0]}\n"
+                        lines.append(f"   ✅ {agent_score.match_reasons[0]}")
                     
-                    response_text += "\n"
+                    lines.append("")
                 
-                response_text += f"💬 To contact an agent, use: @agent-id your message\n"
-                response_text += f"⏱️ Search completed in {search_time:.2f}s"
+                lines.append("💬 To contact an agent, use: @agent-id your message")
+                lines.append(f"⏱️ Search completed in {search_time:.2f}s")
+            response_text = "\n".join(lines)
             
             # Log structured telemetry to MongoDB
             if self.telemetry:
                 response_time = time.time() - search_start
-                self.telemetry.log_structured_query(
+                self._record_telemetry(
+                    "log_structured_query",
                     query_text=query,
                     query_type="search",
                     conversation_id=conversation_id,
@@ -410,11 +816,12 @@ class SimpleAgentBridge(A2AServer):
         except Exception as e:
             logger.error(f"Search error: {e}")
             if self.telemetry:
-                self.telemetry.log_error(f"Search query failed: {str(e)}", {"query": query})
+                self._record_telemetry("log_error", f"Search query failed: {str(e)}", {"query": query})
                 
                 # Log failed search to structured telemetry
                 response_time = time.time() - search_start if 'search_start' in locals() else 0.0
-                self.telemetry.log_structured_query(
+                self._record_telemetry(
+                    "log_structured_query",
                     query_text=query,
                     query_type="search",
                     conversation_id=conversation_id,
@@ -433,6 +840,33 @@ class SimpleAgentBridge(A2AServer):
                 f"🔍 Search failed: {str(e)}"
             )
     
+    def _handle_agent_broadcast(self, user_text: str, original_msg: Message, conversation_id: str) -> Message:
+        """Handle @@agent1,agent2 message by contacting every target concurrently"""
+        match = BROADCAST_RE.match(user_text)
+        targets = []
+        if match is not None:
+            targets_text, message_text = match.groups()
+            targets = list(dict.fromkeys(t.strip().lstrip("@") for t in targets_text.split(",") if t.strip()))
+        if not targets or not message_text.strip():
+            return self._create_response(
+                original_msg, conversation_id,
+                "💬 Usage: @@agent1,agent2 your message"
+            )
+        
+        def send(target_agent_id: str) -> str:
+            start = time.time()
+            result = self._send_to_agent(target_agent_id, message_text, conversation_id)
+            if self.telemetry:
+                self._record_telemetry("log_response_time", time.time() - start, "agent_to_agent")
+            return result
+        
+        # One registry round-trip for every target, then the slowest target bounds total latency
+        self._lookup_agents_bulk(targets)
+        with ThreadPoolExecutor(max_workers=min(MAX_BROADCAST_WORKERS, len(targets))) as pool:
+            results = list(pool.map(send, targets))
+        
+        return self._create_response(original_msg, conversation_id, "\n".join(results))
+    
     def _handle_agent_mention(self, user_text: str, original_msg: Message, conversation_id: str) -> Message:
         """Handle @agent-id mentions for A2A communication"""
         try:
@@ -448,19 +882,20 @@ class SimpleAgentBridge(A2AServer):
             message_text = parts[1]
             
             # Send message to target agent
+            mention_start = time.time()
             response = self._send_to_agent(target_agent_id, message_text, conversation_id)
             
             # Log response time for telemetry
             if self.telemetry:
-                response_time = time.time() - time.time()  # This would be calculated properly in real implementation
-                self.telemetry.log_response_time(response_time, "agent_to_agent")
+                response_time = time.time() - mention_start
+                self._record_telemetry("log_response_time", response_time, "agent_to_agent")
             
             return self._create_response(original_msg, conversation_id, response)
             
         except Exception as e:
             logger.error(f"Agent mention error: {e}")
             if self.telemetry:
-                self.telemetry.log_error(f"Agent mention failed: {str(e)}", {"message": user_text})
+                self._record_telemetry("log_error", f"Agent mention failed: {str(e)}", {"message": user_text})
             
             return self._create_response(
                 original_msg, conversation_id,
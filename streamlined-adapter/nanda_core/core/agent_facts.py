@@ -8,11 +8,18 @@ import json
 import os
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import threading
 
 try:
-    from flask import Flask, jsonify, send_from_directory
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from flask import Flask, Response, jsonify, send_from_directory
+    from ..utils.json_provider import OrjsonProvider
     FLASK_AVAILABLE = True
 except ImportError:
     print("⚠️ Flask not available - AgentFacts server will be disabled")
@@ -32,6 +39,19 @@ class AgentCapabilities:
     reasoning: bool = True
     memory: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the fields (lists are shared, not copied like asdict)"""
+        return {
+            "modalities": self.modalities,
+            "skills": self.skills,
+            "domains": self.domains,
+            "languages": self.languages,
+            "streaming": self.streaming,
+            "batch": self.batch,
+            "reasoning": self.reasoning,
+            "memory": self.memory
+        }
+
 
 @dataclass
 class AgentEndpoints:
@@ -40,6 +60,10 @@ class AgentEndpoints:
     api: Optional[str] = None      # REST API endpoint
     websocket: Optional[str] = None # WebSocket endpoint
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the fields"""
+        return {"static": self.static, "api": self.api, "websocket": self.websocket}
+
 
 @dataclass
 class AgentCertification:
@@ -57,6 +81,15 @@ class AgentCertification:
             expires = datetime.now() + timedelta(days=30)
             self.expires_date = expires.isoformat()
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the fields"""
+        return {
+            "level": self.level,
+            "issued_by": self.issued_by,
+            "issued_date": self.issued_date,
+            "expires_date": self.expires_date
+        }
+
 
 @dataclass
 class AgentFacts:
@@ -119,9 +152,9 @@ class AgentFactsGenerator:
             "provider": agent_facts.provider,
             "jurisdiction": agent_facts.jurisdiction,
             "version": agent_facts.version,
-            "certification": asdict(agent_facts.certification),
-            "capabilities": asdict(agent_facts.capabilities),
-            "endpoints": asdict(agent_facts.endpoints)
+            "certification": agent_facts.certification.to_dict(),
+            "capabilities": agent_facts.capabilities.to_dict(),
+            "endpoints": agent_facts.endpoints.to_dict()
         }
 
         if agent_facts.description:
@@ -139,6 +172,7 @@ class AgentFactsServer:
     def __init__(self, port: int = 8080):
         self.port = port
         self.agent_facts = {}  # agent_id -> AgentFacts
+        self._json_cache: Dict[str, bytes] = {}  # agent_id -> serialized AgentFacts, built on register
         self.server_thread = None
 
         if not FLASK_AVAILABLE:
@@ -147,6 +181,7 @@ class AgentFactsServer:
             return
 
         self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
         self.setup_routes()
 
     def setup_routes(self):
@@ -155,10 +190,9 @@ class AgentFactsServer:
         @self.app.route('/@<agent_id>.json')
         def get_agent_facts(agent_id):
             """Serve AgentFacts JSON for specific agent"""
-            if agent_id in self.agent_facts:
-                generator = AgentFactsGenerator()
-                facts_json = generator.to_json(self.agent_facts[agent_id])
-                return jsonify(facts_json)
+            body = self._json_cache.get(agent_id)
+            if body is not None:
+                return Response(body, mimetype='application/json')
             else:
                 return {"error": f"Agent {agent_id} not found"}, 404
 
@@ -178,6 +212,12 @@ class AgentFactsServer:
     def register_agent_facts(self, agent_id: str, agent_facts: AgentFacts):
         """Register AgentFacts for an agent"""
         self.agent_facts[agent_id] = agent_facts
+        # Serialized once here so the /@<agent_id>.json route is a dict lookup (keys sorted like jsonify)
+        facts_json = AgentFactsGenerator().to_json(agent_facts)
+        if HAS_ORJSON:
+            self._json_cache[agent_id] = orjson.dumps(facts_json, option=orjson.OPT_SORT_KEYS)
+        else:
+            self._json_cache[agent_id] = json.dumps(facts_json, sort_keys=True, separators=(",", ":")).encode()
         print(f"📋 Registered AgentFacts for {agent_id}")
 
     def get_agent_facts_url(self, agent_id: str) -> str:
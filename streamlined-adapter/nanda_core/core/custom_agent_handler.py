@@ -3,6 +3,9 @@
 Custom Agent Handler for attaching user-defined agent logic
 """
 
+import re
+import threading
+from collections import defaultdict
 from typing import Callable, Optional, Dict, Any
 from python_a2a import Message
 
@@ -14,11 +17,20 @@ class CustomAgentHandler:
         self.message_handler: Optional[Callable[[str, str], str]] = None
         self.query_handler: Optional[Callable[[str, str], str]] = None
         self.command_handlers: Dict[str, Callable[[str, str], str]] = {}
+        # message_type -> method; built once so handle_message is a single dict lookup
+        self._dispatch: Dict[str, Callable[[str, str], Optional[str]]] = {
+            "regular": self._handle_regular,
+            "query": self._handle_query,
+            "command": self._handle_command,
+        }
 
         # Conversation control
-        self.conversation_counts: Dict[str, int] = {}
+        self.conversation_counts: Dict[str, int] = defaultdict(int)
+        self._counts_lock = threading.Lock()
         self.max_exchanges_per_conversation: Optional[int] = None
         self.stop_keywords: list = []
+        self._stop_pattern: Optional[re.Pattern] = None  # all stop keywords, lowercased, as one alternation
+        self._stop_keyword_names: Dict[str, str] = {}  # lowercased keyword -> keyword as configured
         self.enable_stop_control: bool = False
 
     def set_message_handler(self, handler: Callable[[str, str], str]):
@@ -61,6 +73,12 @@ class CustomAgentHandler:
         self.enable_stop_control = True
         self.max_exchanges_per_conversation = max_exchanges
         self.stop_keywords = stop_keywords or []
+        # Longer keywords first so the reported keyword is the most specific one at the match position
+        lowered = sorted({keyword.lower() for keyword in self.stop_keywords}, key=len, reverse=True)
+        self._stop_pattern = re.compile("|".join(map(re.escape, lowered))) if lowered else None
+        self._stop_keyword_names = {}
+        for keyword in self.stop_keywords:
+            self._stop_keyword_names.setdefault(keyword.lower(), keyword)
         print(f"🛑 Conversation control enabled: max_exchanges={max_exchanges}, stop_keywords={stop_keywords}")
 
     def should_respond_to_conversation(self, message_text: str, conversation_id: str) -> bool:
@@ -73,22 +91,21 @@ class CustomAgentHandler:
         if not self.enable_stop_control:
             return True  # No control enabled, always respond
 
-        # Track conversation count
-        if conversation_id not in self.conversation_counts:
-            self.conversation_counts[conversation_id] = 0
-        self.conversation_counts[conversation_id] += 1
-
-        current_count = self.conversation_counts[conversation_id]
+        # Track conversation count; the lock keeps concurrent requests from losing increments
+        with self._counts_lock:
+            self.conversation_counts[conversation_id] += 1
+            current_count = self.conversation_counts[conversation_id]
 
         # Check exchange limit
         if self.max_exchanges_per_conversation and current_count > self.max_exchanges_per_conversation:
             print(f"🛑 Conversation {conversation_id} stopped: exceeded max exchanges ({self.max_exchanges_per_conversation})")
             return False
 
-        # Check stop keywords
-        message_lower = message_text.lower()
-        for keyword in self.stop_keywords:
-            if keyword.lower() in message_lower:
+        # Check stop keywords in a single scan of the message
+        if self._stop_pattern is not None:
+            match = self._stop_pattern.search(message_text.lower())
+            if match:
+                keyword = self._stop_keyword_names[match.group()]
                 print(f"🛑 Conversation {conversation_id} stopped: stop keyword '{keyword}' detected")
                 return False
 
@@ -106,19 +123,30 @@ class CustomAgentHandler:
         Returns:
             Custom response or None if no handler available
         """
-        if message_type == "regular" and self.message_handler:
+        handler = self._dispatch.get(message_type)
+        return handler(message_text, conversation_id) if handler else None
+
+    def _handle_regular(self, message_text: str, conversation_id: str) -> Optional[str]:
+        """Pass a regular message to the message handler"""
+        if self.message_handler:
             return self.message_handler(message_text, conversation_id)
-        elif message_type == "query" and self.query_handler:
+        return None
+
+    def _handle_query(self, message_text: str, conversation_id: str) -> Optional[str]:
+        """Pass a query to the query handler"""
+        if self.query_handler:
             return self.query_handler(message_text, conversation_id)
-        elif message_type == "command":
-            # Extract command from message_text
-            parts = message_text.split(" ", 1)
-            command = parts[0][1:] if parts[0].startswith("/") else parts[0]
-            args = parts[1] if len(parts) > 1 else ""
+        return None
 
-            if command in self.command_handlers:
-                return self.command_handlers[command](args, conversation_id)
+    def _handle_command(self, message_text: str, conversation_id: str) -> Optional[str]:
+        """Split '/command args' and call the handler registered for the command"""
+        command, _, args = message_text.partition(" ")
+        if command.startswith("/"):
+            command = command[1:]
 
+        handler = self.command_handlers.get(command)
+        if handler:
+            return handler(args, conversation_id)
         return None
 
     def has_handlers(self) -> bool:
@@ -7,7 +7,9 @@ Handles MCP server discovery and communication without message improvement
 import json
 import base64
 import asyncio
-from typing import Optional, Dict, Any, List
+import time
+from types import SimpleNamespace
+from typing import Optional, Dict, Any, List, Tuple
 from contextlib import AsyncExitStack
 from mcp import ClientSession
 from mcp.client.sse import sse_client
@@ -16,65 +18,198 @@ import mcp
 from anthropic import Anthropic
 import os
 
+from ..utils.cache import TTLCache
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either the same way
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Seconds an initialized MCP session (and its tool list) is reused before reconnecting
+MCP_SESSION_TTL = 300
+
+# Routing plans (the tool calls, arguments included, chosen for a query) are replayed only
+# for the same query text; similar queries can name different entities
+PLAN_CACHE_SIZE = 256
+PLAN_CACHE_TTL = 600
+
+
+def plan_cache_key(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query, ignoring trailing punctuation"""
+    return " ".join(query.lower().split()).rstrip("?!. ")
+
+
+class _CachedSession:
+    """An open MCP session with its tools, held open by the task that entered its contexts
+
+    anyio cancel scopes inside the transports must be exited by the task that entered
+    them, so each session gets an owner task that opens it, waits until asked to close,
+    and then exits the contexts itself.
+    """
+
+    __slots__ = ("session", "tools", "available_tools", "loop", "created", "_owner", "_closing")
+
+    def __init__(self, session, tools, owner: "asyncio.Task", closing: asyncio.Event, loop):
+        self.session = session
+        self.tools = tools
+        # Tool definitions in the shape messages.create expects, built once per session
+        self.available_tools = [{
+            "name": tool.name,
+            "description": tool.description,
+            "input_schema": tool.inputSchema
+        } for tool in tools]
+        self.loop = loop
+        self.created = time.monotonic()
+        self._owner = owner
+        self._closing = closing
+
+    def usable(self) -> bool:
+        """Still within the TTL and bound to the event loop that is running now"""
+        return (time.monotonic() - self.created < MCP_SESSION_TTL
+                and self.loop is asyncio.get_running_loop())
+
+    async def close(self):
+        """Have the owner task exit the session's contexts, waiting for it on the same loop"""
+        if self.loop is asyncio.get_running_loop():
+            self._closing.set()
+            await asyncio.gather(self._owner, return_exceptions=True)
+        elif not self.loop.is_closed():
+            # Another loop (e.g. a previous asyncio.run) still owns it; signal it there
+            self.loop.call_soon_threadsafe(self._closing.set)
+        # A closed loop cancelled the owner on shutdown, which already exited the contexts
+
 
 class MCPClient:
     """Streamlined MCP client without message preprocessing"""
 
     def __init__(self):
         self.session = None
-        self.exit_stack = AsyncExitStack()
         self.anthropic = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY", ""))
+        # (server_url, transport) -> open session, so repeat queries skip the handshake,
+        # initialize() and list_tools() round-trips
+        self._sessions: Dict[Tuple[str, str], _CachedSession] = {}
+        # (server_url, transport, plan_cache_key(query)) -> [(tool name, tool input), ...]
+        self._plans = TTLCache(maxsize=PLAN_CACHE_SIZE, ttl=PLAN_CACHE_TTL)
 
     async def connect_to_server(self, server_url: str, transport_type: str = "http") -> Optional[List[Any]]:
         """Connect to MCP server and return available tools"""
+        cached = await self._get_session(server_url, transport_type)
+        return cached.tools if cached else None
+
+    async def _get_session(self, server_url: str, transport_type: str) -> Optional[_CachedSession]:
+        """Return a live session for the server, reusing a cached one while it is fresh"""
+        key = (server_url, transport_type.lower())
+        cached = self._sessions.get(key)
+        if cached is not None:
+            if cached.usable():
+                self.session = cached.session
+                return cached
+            # Expired, or opened under an event loop that is no longer the current one
+            await self._close_session(key)
+
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        closing = asyncio.Event()
+        owner = loop.create_task(self._own_session(server_url, key[1], ready, closing))
         try:
-            if transport_type.lower() == "sse":
-                transport = await self.exit_stack.enter_async_context(sse_client(server_url))
-                read_stream, write_stream = transport
-            else:
-                transport = await self.exit_stack.enter_async_context(streamablehttp_client(server_url))
-                read_stream, write_stream, _ = transport
-
-            self.session = await self.exit_stack.enter_async_context(
-                mcp.ClientSession(read_stream, write_stream)
-            )
-            await self.session.initialize()
-
-            tools_result = await self.session.list_tools()
-            return tools_result.tools
+            # Shielded so a cancelled caller doesn't cancel the future the owner reports on
+            session, tools = await asyncio.shield(ready)
+        except asyncio.CancelledError:
+            # Our caller gave up; the owner closes the session as soon as it is open
+            closing.set()
+            raise
         except Exception as e:
             print(f"Error connecting to MCP server: {e}")
             return None
 
-    async def execute_query(self, query: str, server_url: str, transport_type: str = "http") -> str:
-        """Execute query on MCP server without message improvement"""
+        cached = _CachedSession(session, tools, owner, closing, loop)
+        self._sessions[key] = cached
+        self.session = session
+        return cached
+
+    @staticmethod
+    async def _own_session(server_url: str, transport_type: str, ready: asyncio.Future, closing: asyncio.Event):
+        """Open the transport and session, publish them on ready, and keep them open until closing is set"""
         try:
-            tools = await self.connect_to_server(server_url, transport_type)
-            if not tools:
-                return "Failed to connect to MCP server"
+            async with AsyncExitStack() as exit_stack:
+                if transport_type == "sse":
+                    transport = await exit_stack.enter_async_context(sse_client(server_url))
+                    read_stream, write_stream = transport
+                else:
+                    transport = await exit_stack.enter_async_context(streamablehttp_client(server_url))
+                    read_stream, write_stream, _ = transport
+
+                session = await exit_stack.enter_async_context(
+                    mcp.ClientSession(read_stream, write_stream)
+                )
+                await session.initialize()
 
-            available_tools = [{
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.inputSchema
-            } for tool in tools]
+                tools_result = await session.list_tools()
+                ready.set_result((session, tools_result.tools))
+                await closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                print(f"Error closing MCP session: {e}")
+        finally:
+            if not ready.done():
+                ready.cancel()
+
+    async def _close_session(self, key: Tuple[str, str]):
+        """Drop a cached session and close its transport"""
+        cached = self._sessions.pop(key, None)
+        if cached is None:
+            return
+        if self.session is cached.session:
+            self.session = None
+        await cached.close()
 
+    async def execute_query(self, query: str, server_url: str, transport_type: str = "http") -> str:
+        """Execute query on MCP server without message improvement"""
+        cached = await self._get_session(server_url, transport_type)
+        if not cached or not cached.tools:
+            return "Failed to connect to MCP server"
+        session = cached.session
+        available_tools = cached.available_tools
+
+        try:
             messages = [{"role": "user", "content": query}]
 
-            message = self.anthropic.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=1024,
-                messages=messages,
-                tools=available_tools
-            )
+            # A repeated query's tool calls stand in for the first LLM round-trip
+            plan_key = (server_url, transport_type.lower(), plan_cache_key(query))
+            plan = self._plans.get(plan_key)
+            tool_names = {tool["name"] for tool in available_tools}
+            if plan is not None and not all(name in tool_names for name, _ in plan):
+                plan = None
+
+            if plan is not None:
+                blocks = [SimpleNamespace(type="tool_use", id=f"toolu_plan_{i}", name=name, input=tool_input)
+                          for i, (name, tool_input) in enumerate(plan)]
+            else:
+                message = self.anthropic.messages.create(
+                    model="claude-3-5-sonnet-20241022",
+                    max_tokens=1024,
+                    messages=messages,
+                    tools=available_tools
+                )
+                blocks = message.content
+                plan = [(block.name, block.input) for block in blocks if block.type == "tool_use"]
+                # Direct answers aren't cached; tools are always re-run for fresh results
+                if plan:
+                    self._plans.set(plan_key, plan)
 
             while True:
                 has_tool_calls = False
 
-                for block in message.content:
+                for block in blocks:
                     if block.type == "tool_use":
                         has_tool_calls = True
-                        result = await self.session.call_tool(block.name, block.input)
+                        result = await session.call_tool(block.name, block.input)
                         processed_result = self._parse_result(result)
 
                         messages.append({
@@ -105,22 +240,25 @@ class MCPClient:
                     messages=messages,
                     tools=available_tools
                 )
+                blocks = message.content
 
             final_response = ""
-            for block in message.content:
+            for block in blocks:
                 if block.type == "text":
                     final_response += block.text + "\n"
 
             return self._parse_result(final_response.strip()) if final_response else "No response generated"
 
         except Exception as e:
+            # The cached session may be what failed; the next query reconnects
+            await self._close_session((server_url, transport_type.lower()))
             return f"Error: {str(e)}"
 
     def _parse_result(self, response: Any) -> str:
         """Parse JSON-RPC responses from MCP server"""
         if isinstance(response, str):
             try:
-                response_json = json.loads(response)
+                response_json = _json_loads(response)
                 if isinstance(response_json, dict) and "result" in response_json:
                     artifacts = response_json["result"].get("artifacts", [])
                     if artifacts and len(artifacts) > 0:
@@ -135,7 +273,8 @@ class MCPClient:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.exit_stack.aclose()
+        for key in list(self._sessions):
+            await self._close_session(key)
         self.session = None
 
 
@@ -157,10 +296,10 @@ class MCPRegistry:
             })
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 endpoint = result.get("endpoint")
                 config = result.get("config")
-                config_json = json.loads(config) if isinstance(config, str) else config
+                config_json = _json_loads(config) if isinstance(config, str) else config
                 registry_name = result.get("registry_provider")
 
                 return {
@@ -5,7 +5,7 @@ MongoDB Agent Facts Client for semantic search testing
 
 import os
 from typing import Dict, List, Any, Optional
-from pymongo import MongoClient
+from ..utils.mongo import get_mongo_client
 from datetime import datetime
 import json
 
@@ -40,7 +40,7 @@ class MongoDBAgentFacts:
     def _connect(self):
         """Connect to MongoDB"""
         try:
-            self.client = MongoClient(self.mongodb_uri, serverSelectionTimeoutMS=5000)
+            self.client = get_mongo_client(self.mongodb_uri)
 
             # Determine DB and collection names
             db_name_env = os.getenv("MONGODB_DB_NAME")
@@ -26,11 +26,17 @@ class CLIPEmbedder(BaseEmbedder):
             self.model = CLIPTextModel.from_pretrained(self.model_name)
             self.tokenizer = CLIPTokenizer.from_pretrained(self.model_name)
             
+            # Run on the GPU in half precision when one is available ('device'/'half' override)
+            self.device = self.config.get('device') or ('cuda' if torch.cuda.is_available() else 'cpu')
+            self.model.to(self.device)
+            if self.config.get('half', self.device.startswith('cuda')):
+                self.model.half()
+            
             # Set to evaluation mode
             self.model.eval()
             
             self.is_available = True
-            print(f"✅ CLIP embedder initialized: {self.model_name}")
+            print(f"✅ CLIP embedder initialized: {self.model_name} on {self.device}")
             
         except ImportError as e:
             self.error_message = f"Missing dependencies: {e}"
@@ -56,13 +62,13 @@ class CLIPEmbedder(BaseEmbedder):
             padding=True, 
             truncation=True, 
             max_length=77
-        )
+        ).to(self.device)
         
         # Get embeddings
         with torch.no_grad():
             outputs = self.model(**inputs)
             # Use the pooled output (CLS token representation)
-            embedding = outputs.pooler_output.squeeze().tolist()
+            embedding = outputs.pooler_output.squeeze().float().tolist()
         
         return embedding
     
@@ -80,13 +86,13 @@ class CLIPEmbedder(BaseEmbedder):
             padding=True, 
             truncation=True, 
             max_length=77
-        )
+        ).to(self.device)
         
         # Get embeddings for all texts
         with torch.no_grad():
             outputs = self.model(**inputs)
             # Use the pooled output for all texts
-            embeddings = outputs.pooler_output.tolist()
+            embeddings = outputs.pooler_output.float().tolist()
         
         return embeddings
     
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Compact storage format for embeddings kept in MongoDB
+
+Vectors are stored as BSON binary vectors (subtype 9): either scaled per-vector
+into int8 (~1 byte per dimension) or packed losslessly as float32 (4 bytes),
+instead of ~10 bytes per dimension for an array of doubles.
+"""
+
+from typing import List, Sequence, Tuple
+
+from bson.binary import Binary, BinaryVectorDtype
+
+
+def quantize_embedding(embedding: Sequence[float]) -> Tuple[Binary, float]:
+    """Return (int8 binary vector, scale) such that value ~= int8 * scale"""
+    peak = max((abs(value) for value in embedding), default=0.0)
+    scale = peak / 127 if peak else 1.0
+    quantized = [round(value / scale) for value in embedding]
+    return Binary.from_vector(quantized, BinaryVectorDtype.INT8), scale
+
+
+def pack_embedding(embedding: Sequence[float]) -> Binary:
+    """Return the embedding as a float32 binary vector (lossless for float32 models)"""
+    return Binary.from_vector(list(embedding), BinaryVectorDtype.FLOAT32)
+
+
+def dequantize_embedding(stored: Binary, scale: float = 1.0) -> List[float]:
+    """Recover float values from a stored embedding (scale is 1.0 for float32 vectors)"""
+    return [value * scale for value in stored.as_vector().data]
@@ -5,7 +5,8 @@ MongoDB Telemetry Storage - Structured telemetry data collection
 
 import os
 from typing import Dict, List, Any, Optional
-from pymongo import MongoClient, ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING
+from ..utils.mongo import get_mongo_client
 from datetime import datetime, timedelta
 import json
 from dataclasses import dataclass, asdict
@@ -99,7 +100,7 @@ class MongoDBTelemetryStorage:
     def _connect(self):
         """Connect to MongoDB and setup collections"""
         try:
-            self.client = MongoClient(self.mongodb_uri, serverSelectionTimeoutMS=5000)
+            self.client = get_mongo_client(self.mongodb_uri)
             self.db = self.client[self.database_name]
             
             # Collections
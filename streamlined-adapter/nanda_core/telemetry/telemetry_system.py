@@ -15,6 +15,12 @@ from .metrics_collector import MetricsCollector
 from .health_monitor import HealthMonitor
 from .mongodb_telemetry import MongoDBTelemetryStorage, QueryTelemetry
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 @dataclass
 class TelemetryEvent:
@@ -320,8 +326,13 @@ class TelemetrySystem:
             date_str = datetime.now().strftime("%Y-%m-%d")
             log_file = os.path.join(self.log_dir, f"events_{date_str}.jsonl")
 
-            with open(log_file, "a") as f:
-                f.write(json.dumps(asdict(event)) + "\n")
+            if HAS_ORJSON:
+                # orjson serializes the dataclass directly, without asdict's deep copy
+                with open(log_file, "ab") as f:
+                    f.write(orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE))
+            else:
+                with open(log_file, "a") as f:
+                    f.write(json.dumps(asdict(event)) + "\n")
 
         except Exception as e:
             # Don't let telemetry errors break the main application
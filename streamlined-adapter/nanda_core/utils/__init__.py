@@ -3,5 +3,16 @@
 Utility functions and helpers for the Streamlined NANDA Adapter
 """
 
-# Placeholder for future utilities
-__all__ = []
\ No newline at end of file
+from .cache import TTLCache
+from .circuit_breaker import CircuitBreaker
+from .keyword_matcher import KeywordMatcher
+from .json_provider import OrjsonProvider
+from .mongo import get_mongo_client
+
+__all__ = [
+    "TTLCache",
+    "CircuitBreaker",
+    "KeywordMatcher",
+    "OrjsonProvider",
+    "get_mongo_client"
+]
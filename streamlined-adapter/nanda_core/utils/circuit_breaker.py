@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Circuit breaker for calls to other agents and remote services
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Dict
+
+
+class CircuitBreaker:
+    """Thread-safe breaker that stops calling a failing dependency for a cool-down period"""
+
+    def __init__(self, failure_threshold: int = 5, window: float = 30.0, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.rejected = 0
+        self.trips = 0
+        self._failures: deque = deque()
+        self._opened_at = None
+        self._half_open = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a call may go through, False while the circuit is open"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: let a trial call through; a failure re-opens immediately
+                self._opened_at = None
+                self._half_open = True
+                self._failures.clear()
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Forget past failures after a successful call"""
+        with self._lock:
+            self._failures.clear()
+            self._half_open = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit once the threshold is exceeded"""
+        now = time.monotonic()
+        with self._lock:
+            if self._half_open:
+                self._half_open = False
+                self._opened_at = now
+                self.trips += 1
+                return
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window:
+                self._failures.popleft()
+            if self._opened_at is None and len(self._failures) > self.failure_threshold:
+                self._opened_at = now
+                self.trips += 1
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def stats(self) -> Dict[str, Any]:
+        """Get breaker state and counters"""
+        return {
+            "state": "open" if self.is_open else "closed",
+            "recent_failures": len(self._failures),
+            "failure_threshold": self.failure_threshold,
+            "window": self.window,
+            "reset_timeout": self.reset_timeout,
+            "trips": self.trips,
+            "rejected": self.rejected
+        }
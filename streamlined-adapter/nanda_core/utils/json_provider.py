@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Flask JSON provider backed by orjson
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Drop-in replacement for Flask's JSON provider that encodes with orjson when available"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not HAS_ORJSON or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._encode(obj).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if not HAS_ORJSON or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Like jsonify(), but hands orjson's bytes straight to the response"""
+        if not HAS_ORJSON:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._encode(obj, indent) + b"\n", mimetype=self.mimetype)
+
+    def _encode(self, obj: Any, indent: bool = False) -> bytes:
+        # Match Flask's defaults: sorted keys, and its fallback for types orjson lacks
+        # (numpy arrays, e.g. embeddings, are serialized natively)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
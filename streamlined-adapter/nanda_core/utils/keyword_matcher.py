@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Multi-keyword matching for agent message routing
+"""
+
+import string
+from bisect import bisect_right
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Punctuation reads as a word break, so "ci/cd", "ci-cd" and "ci cd" all match each other.
+# ASCII text (the common case) is lowercased and cleaned in one bytes.translate pass.
+PUNCTUATION_TO_SPACE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+ASCII_NORMALIZE = bytes.maketrans(
+    (string.ascii_uppercase + string.punctuation).encode(),
+    (string.ascii_lowercase + " " * len(string.punctuation)).encode()
+)
+
+
+def normalize(text: str) -> str:
+    """Lowercase text and turn ASCII punctuation into spaces"""
+    if text.isascii():
+        return text.encode().translate(ASCII_NORMALIZE).decode()
+    return text.lower().translate(PUNCTUATION_TO_SPACE)
+
+
+class KeywordMatcher:
+    """Finds which of a fixed set of keywords occur in a text with one Aho-Corasick scan"""
+
+    # Matchers are immutable once built, so agents with the same keywords share one
+    _shared: Dict[FrozenSet[str], "KeywordMatcher"] = {}
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = frozenset(keyword.lower() for keyword in keywords)
+        # Keywords are matched in normalized form; several may share one pattern
+        self._patterns: Dict[str, Tuple[str, ...]] = {}
+        for keyword in self.keywords:
+            pattern = normalize(keyword)
+            self._patterns[pattern] = self._patterns.get(pattern, ()) + (keyword,)
+        self._automaton = None
+        if HAS_AHOCORASICK and self._patterns:
+            self._automaton = ahocorasick.Automaton()
+            for pattern, matched in self._patterns.items():
+                self._automaton.add_word(pattern, matched)
+            self._automaton.make_automaton()
+
+    @classmethod
+    def shared(cls, keywords: Iterable[str]) -> "KeywordMatcher":
+        """Return the process-wide matcher for this keyword set, building it on first use"""
+        key = frozenset(keyword.lower() for keyword in keywords)
+        matcher = cls._shared.get(key)
+        if matcher is None:
+            matcher = cls._shared.setdefault(key, cls(key))
+        return matcher
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """Return the keywords occurring anywhere in text, compared after normalize()"""
+        text = normalize(text)
+        if self._automaton is not None:
+            return frozenset(keyword for _, matched in self._automaton.iter(text) for keyword in matched)
+        return self._scan(text)
+
+    def _scan(self, text: str) -> FrozenSet[str]:
+        """Substring-test every pattern against normalized text (no pyahocorasick)"""
+        return frozenset(
+            keyword for pattern, matched in self._patterns.items() if pattern in text for keyword in matched
+        )
+
+    def find_batch(self, texts: Iterable[str]) -> List[FrozenSet[str]]:
+        """Return find(text) for each text, scanning them all in one pass"""
+        texts = [normalize(text) for text in texts]
+        if self._automaton is None:
+            return [self._scan(text) for text in texts]
+
+        # Keywords never contain NUL, so no match can span two texts; a match is
+        # attributed to the text its last character falls in
+        starts = []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text) + 1
+
+        found = [set() for _ in texts]
+        for end, matched in self._automaton.iter("\x00".join(texts)):
+            found[bisect_right(starts, end) - 1].update(matched)
+        return [frozenset(keywords) for keywords in found]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Shared MongoDB clients so every component talking to a cluster reuses one connection pool
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+# pymongo >= 4.14 uses the stdlib/backported zstd module, older releases use zstandard
+try:
+    from compression import zstd  # noqa: F401
+    HAS_ZSTD = True
+except ImportError:
+    try:
+        from backports import zstd  # noqa: F401
+        HAS_ZSTD = True
+    except ImportError:
+        try:
+            import pymongo
+            HAS_ZSTD = pymongo.version_tuple < (4, 14)
+            if HAS_ZSTD:
+                import zstandard  # noqa: F401
+        except ImportError:
+            HAS_ZSTD = False
+
+try:
+    import snappy  # noqa: F401 - enables snappy wire compression in pymongo
+    HAS_SNAPPY = True
+except ImportError:
+    HAS_SNAPPY = False
+
+# Wire compression in order of preference; zlib ships with Python
+COMPRESSORS = ",".join(
+    name for name, available in (("zstd", HAS_ZSTD), ("snappy", HAS_SNAPPY), ("zlib", True)) if available
+)
+
+
+@lru_cache(maxsize=8)
+def get_mongo_client(uri: Optional[str] = None):
+    """Return the process-wide MongoClient for uri (default: MONGODB_AGENTFACTS_URI)"""
+    from pymongo import MongoClient
+
+    return MongoClient(
+        uri or os.getenv("MONGODB_AGENTFACTS_URI", "mongodb://localhost:27017/"),
+        maxPoolSize=50,
+        minPoolSize=5,
+        serverSelectionTimeoutMS=5000,
+        compressors=COMPRESSORS
+    )
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test that re-running load_agents.py skips agents that are already up to date
+
+MongoDB and the embedder are replaced with in-memory fakes, so no database or
+API key is needed.
+"""
+
+import os
+import runpy
+import sys
+from contextlib import contextmanager
+from unittest import mock
+
+# Add the current directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import nanda_core.embeddings.embedding_manager as embedding_manager
+import nanda_core.utils as utils
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class FakeCursor(list):
+    def limit(self, n):
+        return FakeCursor(self[:n])
+
+
+class FakeCollection:
+    """Just enough of a pymongo collection for load_agents.py, keyed on agent_id"""
+
+    def __init__(self):
+        self.docs = {}
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+    def find(self, query=None, projection=None):
+        docs = [doc for doc in self.docs.values() if all(doc.get(k) == v for k, v in (query or {}).items())]
+        if projection:
+            docs = [{k: doc[k] for k, keep in projection.items() if keep and k in doc} for doc in docs]
+        return FakeCursor(docs)
+
+    def bulk_write(self, operations, ordered=True):
+        inserted = updated = 0
+        for op in operations:
+            agent_id = op._filter['agent_id']
+            doc = self.docs.setdefault(agent_id, {'agent_id': agent_id})
+            if len(doc) == 1:
+                inserted += 1
+            else:
+                updated += 1
+            doc.update(op._doc['$set'])
+            for field in op._doc.get('$unset', {}):
+                doc.pop(field, None)
+        return mock.Mock(upserted_count=inserted, matched_count=updated)
+
+    def count_documents(self, query):
+        return len(self.docs)
+
+    def distinct(self, field):
+        return sorted({doc.get(field) for doc in self.docs.values()})
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.texts = 0
+
+    def create_batch_embeddings(self, texts):
+        self.texts += len(texts)
+        return [[0.1, 0.2, 0.3, 0.4] for _ in texts]
+
+    def create_embedding(self, text):
+        return self.create_batch_embeddings([text])[0]
+
+
+@contextmanager
+def fake_backends(collection, embedder):
+    db = mock.MagicMock(name='db')
+    db.name = 'nanda_agentfacts'
+    db.__getitem__.return_value = collection
+    client = mock.MagicMock(name='client')
+    client.__getitem__.return_value = db
+    cwd = os.getcwd()
+    os.chdir(HERE)
+    try:
+        with mock.patch.dict(os.environ, {'MONGODB_AGENTFACTS_URI': 'mongodb://fake'}), \
+                mock.patch.object(utils, 'get_mongo_client', lambda uri: client), \
+                mock.patch.object(embedding_manager, 'create_batch_embeddings', embedder.create_batch_embeddings), \
+                mock.patch.object(embedding_manager, 'create_embedding', embedder.create_embedding):
+            yield
+    finally:
+        os.chdir(cwd)
+
+
+def run_loader(collection, embedder):
+    with fake_backends(collection, embedder):
+        runpy.run_path(os.path.join(HERE, 'load_agents.py'), run_name='load_agents')
+
+
+def test_rerun_with_identical_input_embeds_nothing():
+    """The second run finds every stored hash current and never calls the embedder"""
+    collection = FakeCollection()
+    first = FakeEmbedder()
+    run_loader(collection, first)
+    loaded = dict(collection.docs)
+    assert first.texts > 0
+    assert len(loaded) == first.texts
+    assert all(doc.get('content_hash') for doc in loaded.values())
+
+    second = FakeEmbedder()
+    run_loader(collection, second)
+    assert second.texts == 0
+    assert collection.docs == loaded
+
+
+def test_changed_agent_is_re_embedded():
+    """An agent whose stored document no longer matches its input is embedded and written again"""
+    collection = FakeCollection()
+    run_loader(collection, FakeEmbedder())
+    stale_id = next(iter(collection.docs))
+    collection.docs[stale_id]['content_hash'] = 'stale'
+
+    embedder = FakeEmbedder()
+    run_loader(collection, embedder)
+    assert embedder.texts == 1
+    assert collection.docs[stale_id]['content_hash'] != 'stale'
+
+
+if __name__ == "__main__":
+    print("🧪 Testing load_agents re-runs")
+    test_rerun_with_identical_input_embeds_nothing()
+    test_changed_agent_is_re_embedded()
+    print("✅ load_agents tests passed")
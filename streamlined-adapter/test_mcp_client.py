@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Test MCPClient session reuse and routing-plan caching
+
+The MCP transport and the Anthropic client are replaced with in-memory fakes,
+so no server or API key is needed.
+"""
+
+import asyncio
+import importlib
+import os
+import sys
+import types
+from contextlib import asynccontextmanager, contextmanager
+
+# Add the current directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeTool:
+    def __init__(self, name):
+        self.name = name
+        self.description = f"{name} tool"
+        self.inputSchema = {"type": "object"}
+
+
+class FakeServer:
+    """Records connections and tool calls made through the fake transport"""
+
+    def __init__(self):
+        self.connects = 0
+        self.closes = 0
+        self.tool_calls = []
+        self.open = 0
+        self.foreign_exits = 0  # transports exited by a task other than the one that entered them
+
+
+def fake_modules(server):
+    """Module stand-ins for mcp and anthropic wired to one FakeServer"""
+
+    class FakeSession:
+        def __init__(self, read_stream, write_stream):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            server.closes += 1
+
+        async def initialize(self):
+            pass
+
+        async def list_tools(self):
+            return types.SimpleNamespace(tools=[FakeTool("get_weather")])
+
+        async def call_tool(self, name, arguments):
+            server.tool_calls.append((name, dict(arguments)))
+            return f"sunny in {arguments.get('city')}"
+
+    @asynccontextmanager
+    async def transport(url, streams=(None, None, None)):
+        server.connects += 1
+        server.open += 1
+        entered_by = asyncio.current_task()
+        try:
+            yield streams
+        finally:
+            server.open -= 1
+            if asyncio.current_task() is not entered_by:
+                server.foreign_exits += 1
+
+    class FakeMessages:
+        """Plans one get_weather call for the last word of the query, then answers"""
+
+        def __init__(self):
+            self.calls = 0
+
+        def create(self, messages, **kwargs):
+            self.calls += 1
+            if len(messages) == 1:
+                city = messages[0]["content"].rstrip("?!. ").split()[-1]
+                block = types.SimpleNamespace(type="tool_use", id=f"toolu_{self.calls}",
+                                              name="get_weather", input={"city": city})
+                return types.SimpleNamespace(content=[block])
+            text = messages[-1]["content"][0]["content"]
+            return types.SimpleNamespace(content=[types.SimpleNamespace(type="text", text=text)])
+
+    mcp = types.ModuleType("mcp")
+    mcp.ClientSession = FakeSession
+    sse = types.ModuleType("mcp.client.sse")
+    sse.sse_client = lambda url: transport(url, streams=(None, None))
+    streamable_http = types.ModuleType("mcp.client.streamable_http")
+    streamable_http.streamablehttp_client = transport
+    anthropic = types.ModuleType("anthropic")
+    anthropic.Anthropic = lambda api_key: types.SimpleNamespace(messages=FakeMessages())
+    return {
+        "mcp": mcp,
+        "mcp.client": types.ModuleType("mcp.client"),
+        "mcp.client.sse": sse,
+        "mcp.client.streamable_http": streamable_http,
+        "anthropic": anthropic,
+    }
+
+
+@contextmanager
+def mcp_client_module(server):
+    """Import nanda_core.core.mcp_client against the fakes; the faked modules are restored afterwards"""
+    # Only these entries are swapped; restoring all of sys.modules would also drop
+    # modules first imported here (json, orjson), and C extensions don't re-import cleanly
+    fakes = fake_modules(server)
+    names = list(fakes) + ["nanda_core.core.mcp_client"]
+    saved = {name: sys.modules.pop(name) for name in names if name in sys.modules}
+    sys.modules.update(fakes)
+    try:
+        yield importlib.import_module("nanda_core.core.mcp_client")
+    finally:
+        for name in names:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved)
+
+
+def test_similar_queries_do_not_share_tool_arguments():
+    """Queries differing by one entity must each get their own tool arguments"""
+    server = FakeServer()
+    # Long enough that a bag-of-words similarity between the two is well above 0.95
+    filler = ("I am planning a long weekend trip with my family and would like a detailed forecast "
+              "for every day including the expected high and low temperatures wind speed and direction "
+              "humidity chance of rain and any severe weather warnings that might affect outdoor plans in")
+
+    async def run(mcp_client):
+        async with mcp_client.MCPClient() as client:
+            await client.execute_query(f"{filler} Boston", "http://mcp.test")
+            await client.execute_query(f"{filler} Seattle", "http://mcp.test")
+            return client.anthropic.messages.calls
+
+    with mcp_client_module(server) as mcp_client:
+        llm_calls = asyncio.run(run(mcp_client))
+
+    assert server.tool_calls == [("get_weather", {"city": "Boston"}), ("get_weather", {"city": "Seattle"})]
+    assert llm_calls == 4  # routing + answer for each query
+
+
+def test_repeated_query_reuses_plan_and_session():
+    """The same query (modulo case/whitespace) skips the routing call but re-runs the tool"""
+    server = FakeServer()
+
+    async def run(mcp_client):
+        async with mcp_client.MCPClient() as client:
+            first = await client.execute_query("Weather in Boston?", "http://mcp.test")
+            second = await client.execute_query("  weather in   boston ", "http://mcp.test")
+            return first, second, client.anthropic.messages.calls
+
+    with mcp_client_module(server) as mcp_client:
+        first, second, llm_calls = asyncio.run(run(mcp_client))
+
+    assert first == second == "sunny in Boston"
+    assert server.tool_calls == [("get_weather", {"city": "Boston"})] * 2
+    assert llm_calls == 3
+    assert server.connects == 1
+    assert server.closes == 1
+
+
+def test_sessions_close_in_their_own_task():
+    """Expired, failed and remaining sessions are all exited by the task that opened them"""
+    server = FakeServer()
+
+    async def run(mcp_client):
+        async with mcp_client.MCPClient() as client:
+            await client.execute_query("weather in Boston", "http://mcp.test")
+            client._sessions[("http://mcp.test", "http")].created -= mcp_client.MCP_SESSION_TTL
+            await client.execute_query("weather in Boston", "http://mcp.test")
+            await client.execute_query("weather in Boston", "http://other.test", transport_type="sse")
+            assert server.open == 2
+
+    with mcp_client_module(server) as mcp_client:
+        asyncio.run(run(mcp_client))
+
+    assert server.connects == 3
+    assert server.open == 0
+    assert server.foreign_exits == 0
+
+
+def test_new_event_loop_per_call_does_not_leak_sessions():
+    """A client driven by asyncio.run per query reconnects and leaves nothing open"""
+    server = FakeServer()
+
+    with mcp_client_module(server) as mcp_client:
+        client = mcp_client.MCPClient()
+        for _ in range(3):
+            assert asyncio.run(client.execute_query("weather in Boston", "http://mcp.test")) == "sunny in Boston"
+            assert server.open == 0
+        asyncio.run(client.__aexit__(None, None, None))
+
+    assert server.connects == 3
+    assert server.foreign_exits == 0
+    assert not client._sessions
+
+
+if __name__ == "__main__":
+    print("🧪 Testing MCP client caching")
+    test_similar_queries_do_not_share_tool_arguments()
+    test_repeated_query_reuses_plan_and_session()
+    test_sessions_close_in_their_own_task()
+    test_new_event_loop_per_call_does_not_leak_sessions()
+    print("✅ MCP client tests passed")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test the shared utilities: TTLCache, CircuitBreaker, KeywordMatcher and
+the helpful_agent arithmetic evaluator
+"""
+
+import os
+import sys
+import time
+
+# Add the current directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from nanda_core.utils import CircuitBreaker, KeywordMatcher, TTLCache
+from nanda_core.core.adapter import evaluate_arithmetic
+
+
+def test_ttl_cache_expiry():
+    """Entries disappear once their TTL (default or per-entry) has passed"""
+    cache = TTLCache(maxsize=10, ttl=0.05)
+    cache.set("default", 1)
+    cache.set("long", 2, ttl=60)
+    assert cache.get("default") == 1
+
+    time.sleep(0.1)
+    assert cache.get("default") is None
+    assert cache.get("default", "missing") == "missing"
+    assert cache.get("long") == 2
+    assert len(cache) == 1
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_ttl_cache_lru_eviction():
+    """A full cache evicts the least recently used entry; get() counts as a use"""
+    cache = TTLCache(maxsize=3, ttl=60)
+    for key in "abc":
+        cache.set(key, key.upper())
+    assert cache.get("a") == "A"  # "b" is now the oldest
+
+    cache.set("d", "D")
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["A", "C", "D"]
+
+    cache.set("c", "C2")  # overwriting also refreshes recency, leaving "a" oldest
+    cache.set("e", "E")
+    assert cache.get("a") is None
+    assert len(cache) == 3
+
+
+def test_circuit_breaker_opens_after_threshold():
+    """The circuit opens once failures exceed the threshold and rejects calls while open"""
+    breaker = CircuitBreaker(failure_threshold=2, window=60, reset_timeout=60)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.allow() and not breaker.is_open
+
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow()
+    assert not breaker.allow()
+    assert breaker.stats()["state"] == "open"
+    assert breaker.trips == 1
+    assert breaker.rejected == 2
+
+
+def test_circuit_breaker_success_resets_failures():
+    """A success forgets earlier failures"""
+    breaker = CircuitBreaker(failure_threshold=2, window=60, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.is_open
+
+
+def test_circuit_breaker_half_open():
+    """After reset_timeout one trial call is let through; its outcome closes or re-opens the circuit"""
+    breaker = CircuitBreaker(failure_threshold=0, window=60, reset_timeout=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    # Trial call fails: re-opened immediately, without counting up to the threshold again
+    time.sleep(0.1)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow()
+    assert breaker.trips == 2
+
+    # Trial call succeeds: closed, and stays closed until failures exceed the threshold again
+    time.sleep(0.1)
+    assert breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.allow()
+    assert breaker.stats()["state"] == "closed"
+
+
+def test_keyword_matcher_find_batch_offsets():
+    """find_batch attributes every match to the text it occurs in, same as find() per text"""
+    matcher = KeywordMatcher(["stock", "ci/cd", "weather", "bond"])
+    texts = [
+        "Check the STOCK",           # keyword at the very end of a text
+        "stock market",              # ...and at the very start of the next
+        "",
+        "ci-cd pipeline and weather",
+        "nothing here",
+        "bond",                      # a whole text that is a keyword
+        "stockbond",                 # adjacent keywords inside one text
+    ]
+    expected = [
+        {"stock"},
+        {"stock"},
+        set(),
+        {"ci/cd", "weather"},
+        set(),
+        {"bond"},
+        {"stock", "bond"},
+    ]
+
+    assert [set(found) for found in matcher.find_batch(texts)] == expected
+    assert matcher.find_batch(texts) == [matcher.find(text) for text in texts]
+    assert matcher.find_batch([]) == []
+
+    # The substring fallback (no pyahocorasick) must agree
+    fallback = KeywordMatcher(matcher.keywords)
+    fallback._automaton = None
+    assert fallback.find_batch(texts) == matcher.find_batch(texts)
+
+
+def test_evaluate_arithmetic():
+    """Whitelisted operators evaluate with normal precedence"""
+    assert evaluate_arithmetic("2 + 3 * 4") == 14
+    assert evaluate_arithmetic(" (2 + 3) * 4 ") == 20
+    assert evaluate_arithmetic("7 / 2") == 3.5
+    assert evaluate_arithmetic("7 // 2") == 3
+    assert evaluate_arithmetic("7 % 3") == 1
+    assert evaluate_arithmetic("-3 + +1.5") == -1.5
+
+
+def test_evaluate_arithmetic_rejects_unsafe_input():
+    """Names, calls, attributes and ** are refused; division by zero raises"""
+    for expression in ["x + 1", "abs(-1)", "__import__('os')", "(1).real", "2 ** 10", "'a' * 3", "True + 1"]:
+        try:
+            evaluate_arithmetic(expression)
+        except ValueError:
+            continue
+        raise AssertionError(f"{expression!r} should be rejected")
+
+    for expression in ["1 / 0", "1 // 0", "1 % 0"]:
+        try:
+            evaluate_arithmetic(expression)
+        except ZeroDivisionError:
+            continue
+        raise AssertionError(f"{expression!r} should raise ZeroDivisionError")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing shared utilities")
+    test_ttl_cache_expiry()
+    test_ttl_cache_lru_eviction()
+    test_circuit_breaker_opens_after_threshold()
+    test_circuit_breaker_success_resets_failures()
+    test_circuit_breaker_half_open()
+    test_keyword_matcher_find_batch_offsets()
+    test_evaluate_arithmetic()
+    test_evaluate_arithmetic_rejects_unsafe_input()
+    print("✅ Utility tests passed")